@@ -43,6 +43,13 @@ from items.services.items_gateway.sessions import Sessions
 from items.services.items_gateway.route_injections import RouteInjections
 from items.services.items_gateway.services.smtp_email_service import SmtpEmailService
 
+# Health checks poll the dependent services until they are up; compile their
+# response schemas once instead of on every poll.
+_IDENTITY_SVC_HEALTH_VALIDATOR = jsonschema.Draft7Validator(
+    SCHEMA_IDENTITY_SVC_HEALTH_RESPONSE)
+_CMS_SVC_HEALTH_VALIDATOR = jsonschema.Draft7Validator(
+    SCHEMA_CMS_SVC_HEALTH_RESPONSE)
+
 
 class Service(BaseMicroservice):
     """ ITEMS Gateway Microservice """
@@ -216,8 +223,7 @@ class Service(BaseMicroservice):
             return None
 
         try:
-            jsonschema.validate(instance=response.body,
-                                schema=SCHEMA_IDENTITY_SVC_HEALTH_RESPONSE)
+            _IDENTITY_SVC_HEALTH_VALIDATOR.validate(response.body)
 
         except jsonschema.exceptions.ValidationError as ex:
             raise RuntimeError(
@@ -274,8 +280,7 @@ class Service(BaseMicroservice):
             return None
 
         try:
-            jsonschema.validate(instance=response.body,
-                                schema=SCHEMA_CMS_SVC_HEALTH_RESPONSE)
+            _CMS_SVC_HEALTH_VALIDATOR.validate(response.body)
 
         except jsonschema.exceptions.ValidationError as ex:
             raise RuntimeError(
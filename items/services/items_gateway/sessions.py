@@ -19,7 +19,7 @@ from dataclasses import dataclass
 from items.shared.account_logon_type import AccountLogonType
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionEntry:
     """
     Represents an authentication session entry.
@@ -50,7 +50,7 @@ class InviteUninviteStatus(Enum):
     NO_PENDING_INVITE = auto()    # no pending invite found for email
 
 
-@dataclass
+@dataclass(slots=True)
 class InviteCreateResult:
     """Result returned by :meth:`InviteManagementService.create_invite`."""
 
@@ -58,7 +58,7 @@ class InviteCreateResult:
     token: Optional[str] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class InviteResendResult:
     """Result returned by :meth:`InviteManagementService.resend_invite`."""
 
@@ -66,7 +66,7 @@ class InviteResendResult:
     token: Optional[str] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class InviteUninviteResult:
     """Result returned by :meth:`InviteManagementService.uninvite`."""
 
@@ -68,7 +68,7 @@ def _row_to_dict(row: tuple) -> dict:
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class UserListResult:
     """Outcome of a list-all-users request.
 
@@ -80,7 +80,7 @@ class UserListResult:
     users: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserLookupResult:
     """Outcome of a single-user lookup.
 
@@ -94,7 +94,7 @@ class UserLookupResult:
     user: Optional[dict] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserCreateResult:
     """Outcome of a create-user request.
 
@@ -111,7 +111,7 @@ class UserCreateResult:
     generated_password: Optional[str] = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserUpdateResult:
     """Outcome of an update-user request.
 
@@ -127,7 +127,7 @@ class UserUpdateResult:
     success: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PasswordResult:
     """Outcome of a password change or reset request.
 
@@ -22,7 +22,7 @@ from items.services.items_identity.data_access.user_repository import (
 from items.shared.service_state import ServiceState
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfileResult:
     """Outcome of a user profile lookup.
 
@@ -14,6 +14,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import asyncio
 from http import HTTPStatus
 import json
 import logging
@@ -81,17 +82,28 @@ class GetProjectTestcasesPageHandler(PortalPageHandler):
         """
         gateway_svc: str = self._config.apis_gateway_svc
 
-        # Fetch project details to get the project name for the sidebar.
+        # The project details (for the sidebar project name) and the test
+        # cases are independent, so both gateway requests are made at once.
         project_url: str = f"{gateway_svc}web/projects/{project_id}"
-        project_response = await self._rest_client.get(project_url)
+        url: str = f"{gateway_svc}web/{project_id}/testcases"
+        project_task = asyncio.ensure_future(
+            self._rest_client.get(project_url))
+        testcases_task = asyncio.ensure_future(self._rest_client.get(url))
+        try:
+            project_response, response = await asyncio.gather(
+                project_task, testcases_task)
+
+        except BaseException:
+            # gather() leaves the other request running if one raises, so
+            # cancel it rather than let it finish unobserved.
+            project_task.cancel()
+            testcases_task.cancel()
+            raise
 
         project_name: str = "Unknown Project"
         if project_response.status_code == HTTPStatus.OK:
             project_name = project_response.body.get("name", project_name)
 
-        url: str = f"{gateway_svc}web/{project_id}/testcases"
-        response = await self._rest_client.get(url)
-
         if response.status_code != HTTPStatus.OK:
             self._logger.critical("Gateway svc request invalid - Reason: %s",
                                   response.exception_msg)
@@ -114,7 +126,8 @@ class GetProjectTestcasesPageHandler(PortalPageHandler):
             project_name=project_name,
             instance_name=self._metadata_settings.instance_name)
 
-    def _transform_tests_details_data(self, data):
+    @staticmethod
+    def _transform_tests_details_data(data):
         """Converts flat folder and test case data into a hierarchical tree.
 
         The incoming data is expected to contain two collections:
@@ -44,6 +44,12 @@ SCHEMA_SESSION_VALIDATE_RESPONSE = {
     "additionalProperties": False
 }
 
+# Every page request validates its session, so the response validator is
+# built once here instead of jsonschema.validate() re-checking the schema and
+# constructing a new validator on each call.
+_SESSION_VALIDATE_RESPONSE_VALIDATOR = jsonschema.Draft202012Validator(
+    SCHEMA_SESSION_VALIDATE_RESPONSE)
+
 
 class SessionAuthMixin:
     """Provides shared session authentication functionality for page handlers.
@@ -135,8 +141,7 @@ class SessionAuthMixin:
                 f"{response.status_code}{detail}")
 
         try:
-            jsonschema.validate(instance=response.body,
-                                schema=SCHEMA_SESSION_VALIDATE_RESPONSE)
+            _SESSION_VALIDATE_RESPONSE_VALIDATOR.validate(response.body)
 
         except jsonschema.exceptions.ValidationError as ex:
             raise BaseItemsException(
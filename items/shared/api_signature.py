@@ -19,6 +19,25 @@ import hmac
 import json
 
 
+def _signing_payload(data: dict | str | bytes) -> bytes:
+    """
+    Convert data into the bytes that are signed. Dictionaries are serialised
+    to compact JSON with sorted keys so both sides produce the same bytes,
+    and encoded as ASCII as json.dumps escapes all non-ASCII characters.
+    """
+    if isinstance(data, bytes):
+        return data
+
+    if isinstance(data, str):
+        return data.encode('utf-8')
+
+    if isinstance(data, dict):
+        return json.dumps(data, separators=(',', ':'),
+                          sort_keys=True).encode('ascii')
+
+    raise TypeError("Data must be a str, bytes, or dict")
+
+
 def verify_api_signature(secret_key: bytes,
                          data: dict | str | bytes,
                          received_signature: str) -> bool:
@@ -35,16 +54,8 @@ def verify_api_signature(secret_key: bytes,
         bool: True if the computed api signature matches the received
               signature, False otherwise.
     """
-    if isinstance(data, dict):
-        data = json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8')
-    elif isinstance(data, str):
-        data = data.encode('utf-8')
-    elif isinstance(data, bytes):
-        pass
-    else:
-        raise TypeError("Data must be a str, bytes, or dict")
-
-    computed_signature = hmac.new(secret_key, data, hashlib.sha256).hexdigest()
+    computed_signature = hmac.new(secret_key, _signing_payload(data),
+                                  hashlib.sha256).hexdigest()
     return hmac.compare_digest(computed_signature, received_signature)
 
 
@@ -61,14 +72,5 @@ def generate_api_signature(secret_key: bytes,
     Returns:
         str: The generated HMAC signature as a hexadecimal string.
     """
-    if isinstance(data, dict):
-        # Convert dictionary to JSON string
-        data = json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8')
-    elif isinstance(data, str):
-        data = data.encode('utf-8')  # Ensure it's in bytes
-    elif isinstance(data, bytes):
-        pass  # Already in bytes
-    else:
-        raise TypeError("Data must be a str, bytes, or dict")
-
-    return hmac.new(secret_key, data, hashlib.sha256).hexdigest()
+    return hmac.new(secret_key, _signing_payload(data),
+                    hashlib.sha256).hexdigest()
@@ -1,6 +1,5 @@
 import unittest
 from unittest.mock import MagicMock
-import json
 import logging
 import time
 from quart import Response
@@ -31,7 +30,7 @@ class TestApiHealthApiView(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(response, Response)
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        data = json.loads(await response.get_data(as_text=True))
+        data = await response.get_json()
         self.assertEqual(data["status"], ServiceDegradationStatus.HEALTHY.value)
         self.assertEqual(data["issues"], None)
         self.assertEqual(data["uptime_seconds"], 5000)
@@ -48,13 +47,13 @@ class TestApiHealthApiView(unittest.IsolatedAsyncioTestCase):
         response = await self.view.health()
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        data = json.loads(await response.get_data(as_text=True))
+        data = await response.get_json()
         self.assertEqual(data["status"], ServiceDegradationStatus.DEGRADED.value)
-        self.assertEqual(len(data["issues"]), 1)
-        self.assertEqual(data["issues"][0]["component"], "database")
-        self.assertEqual(data["issues"][0]["status"],
-                         ComponentDegradationLevel.PART_DEGRADED.value)
-        self.assertEqual(data["issues"][0]["details"], "Slow queries detected")
+        self.assertEqual(data["issues"], [{
+            "component": "database",
+            "status": ComponentDegradationLevel.PART_DEGRADED.value,
+            "details": "Slow queries detected",
+        }])
 
     async def test_health_critical(self):
         self.mock_state.database_health = ComponentDegradationLevel.FULLY_DEGRADED
@@ -63,13 +62,13 @@ class TestApiHealthApiView(unittest.IsolatedAsyncioTestCase):
         response = await self.view.health()
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        data = json.loads(await response.get_data(as_text=True))
+        data = await response.get_json()
         self.assertEqual(data["status"], ServiceDegradationStatus.CRITICAL.value)
-        self.assertEqual(len(data["issues"]), 1)
-        self.assertEqual(data["issues"][0]["component"], "database")
-        self.assertEqual(data["issues"][0]["status"],
-                         ComponentDegradationLevel.FULLY_DEGRADED.value)
-        self.assertEqual(data["issues"][0]["details"], "Database down")
+        self.assertEqual(data["issues"], [{
+            "component": "database",
+            "status": ComponentDegradationLevel.FULLY_DEGRADED.value,
+            "details": "Database down",
+        }])
 
     async def test_health_service_degraded_adds_service_issue(self):
         self.mock_state.service_health = ComponentDegradationLevel.PART_DEGRADED
@@ -78,10 +77,10 @@ class TestApiHealthApiView(unittest.IsolatedAsyncioTestCase):
         response = await self.view.health()
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        data = json.loads(await response.get_data(as_text=True))
+        data = await response.get_json()
         self.assertEqual(data["status"], ServiceDegradationStatus.DEGRADED.value)
-        self.assertEqual(len(data["issues"]), 1)
-        self.assertEqual(data["issues"][0]["component"], "service")
-        self.assertEqual(data["issues"][0]["status"],
-                         ComponentDegradationLevel.PART_DEGRADED.value)
-        self.assertEqual(data["issues"][0]["details"], "Memory pressure")
+        self.assertEqual(data["issues"], [{
+            "component": "service",
+            "status": ComponentDegradationLevel.PART_DEGRADED.value,
+            "details": "Memory pressure",
+        }])
@@ -14,10 +14,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import os
+import shutil
 import sqlite3
 import tempfile
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 from items.services.items_cms.repositories.project_repository import ProjectRepository
 from items.services.items_cms.cms_configuration import CMSConfiguration
 
@@ -36,22 +37,37 @@ CREATE TABLE prj_projects (
 class TestProjectRepository(unittest.IsolatedAsyncioTestCase):
     """Integration tests for ProjectRepository against a real SQLite DB."""
 
-    async def asyncSetUp(self):
-        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+    @classmethod
+    def setUpClass(cls):
+        # Build the schema and the repository once; each test restores the
+        # shared database file from the pristine template.
+        fd, cls.template_db_path = tempfile.mkstemp(suffix=".db")
         os.close(fd)
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(cls.template_db_path)
         conn.executescript(_SCHEMA_SQL)
         conn.close()
 
-        mock_config = MagicMock(spec=CMSConfiguration)
-        mock_config.backend_db_filename = self.db_path
-        self.repo = ProjectRepository(MagicMock(), mock_config)
+        fd, cls.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+
+        mock_config = Mock(spec=CMSConfiguration)
+        mock_config.backend_db_filename = cls.db_path
+        cls.mock_logger = Mock()
+        cls.repo = ProjectRepository(cls.mock_logger, mock_config)
+
+    @classmethod
+    def tearDownClass(cls):
+        for path in (cls.db_path, cls.template_db_path):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
 
-    async def asyncTearDown(self):
-        try:
-            os.unlink(self.db_path)
-        except OSError:
-            pass
+    async def asyncSetUp(self):
+        # Everything shared by the class is reset here, so no test depends
+        # on what an earlier one left behind.
+        shutil.copyfile(self.template_db_path, self.db_path)
+        self.mock_logger.reset_mock()
 
     # ------------------------------------------------------------------
     # Helpers
@@ -106,11 +122,9 @@ class TestProjectRepository(unittest.IsolatedAsyncioTestCase):
         pid = self._insert_project(
             "Alpha", announcement="Hello", show_on_overview=True)
         result = await self.repo.get_project_details(pid)
-        self.assertIsNotNone(result)
-        self.assertEqual(result["id"], pid)
-        self.assertEqual(result["name"], "Alpha")
-        self.assertEqual(result["announcement"], "Hello")
-        self.assertEqual(result["show_announcement_on_overview"], 1)
+        self.assertEqual(result, {"id": pid, "name": "Alpha",
+                                  "announcement": "Hello",
+                                  "show_announcement_on_overview": 1})
 
     # ------------------------------------------------------------------
     # get_projects
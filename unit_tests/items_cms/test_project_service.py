@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import unittest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, Mock
 from weaver_framework.database.sqlite_interface import SqliteInterfaceException
 from items.services.items_cms.services.project_service import ProjectService
 from items.services.items_cms.repositories.project_repository import (
@@ -22,35 +22,65 @@ from items.services.items_cms.repositories.project_repository import (
 )
 from items.shared.service_state import ServiceState
 
+# (operation, first repository method called, service call) for each public
+# operation. Used to drive the failure paths that every operation shares.
+_OPERATIONS = [
+    ("get_project", "get_project_details",
+     lambda svc: svc.get_project(1)),
+    ("list_projects", "get_projects",
+     lambda svc: svc.list_projects(["name"], False, False)),
+    ("create_project", "project_name_exists",
+     lambda svc: svc.create_project("Alpha", "", False)),
+    ("modify_project", "get_project_details",
+     lambda svc: svc.modify_project(1, "Alpha", "", False)),
+    ("delete_project", "is_valid_project_id",
+     lambda svc: svc.delete_project(1, False)),
+]
+
 
 class TestProjectService(unittest.IsolatedAsyncioTestCase):
     """Unit tests for ProjectService."""
 
     async def asyncSetUp(self):
-        self.mock_logger = MagicMock()
-        self.mock_state = MagicMock(spec=ServiceState)
+        self.mock_logger = Mock()
+        self.mock_state = Mock(spec=ServiceState)
         self.mock_state.is_available.return_value = True
         self.mock_repo = AsyncMock(spec=ProjectRepository)
         self.service = ProjectService(
             self.mock_logger, self.mock_state, self.mock_repo)
 
+    def _reset_mocks(self):
+        self.mock_state.reset_mock(return_value=True, side_effect=True)
+        self.mock_state.is_available.return_value = True
+        self.mock_repo.reset_mock(return_value=True, side_effect=True)
+
     # ------------------------------------------------------------------
-    # get_project
+    # Failure paths shared by every operation
     # ------------------------------------------------------------------
 
-    async def test_get_project_service_unavailable(self):
-        self.mock_state.is_available.return_value = False
-        result = await self.service.get_project(1)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
+    async def test_service_unavailable(self):
+        for operation, _, call in _OPERATIONS:
+            with self.subTest(operation=operation):
+                self._reset_mocks()
+                self.mock_state.is_available.return_value = False
+                result = await call(self.service)
+                self.assertFalse(result.success)
+                self.assertTrue(result.is_internal)
+
+    async def test_first_repository_call_db_exception(self):
+        for operation, repo_method, call in _OPERATIONS:
+            with self.subTest(operation=operation):
+                self._reset_mocks()
+                getattr(self.mock_repo, repo_method).side_effect = (
+                    SqliteInterfaceException("err"))
+                result = await call(self.service)
+                self.assertFalse(result.success)
+                self.assertTrue(result.is_internal)
+                self.mock_state.mark_database_failed.assert_called_once()
 
-    async def test_get_project_db_exception(self):
-        self.mock_repo.get_project_details.side_effect = (
-            SqliteInterfaceException("err"))
-        result = await self.service.get_project(1)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-        self.mock_state.mark_database_failed.assert_called_once()
+    # ------------------------------------------------------------------
+    # get_project
+    # ------------------------------------------------------------------
 
     async def test_get_project_not_found(self):
         self.mock_repo.get_project_details.return_value = None
@@ -69,20 +99,6 @@ class TestProjectService(unittest.IsolatedAsyncioTestCase):
     # list_projects
     # ------------------------------------------------------------------
 
-    async def test_list_projects_service_unavailable(self):
-        self.mock_state.is_available.return_value = False
-        result = await self.service.list_projects(["name"], False, False)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-
-    async def test_list_projects_db_exception(self):
-        self.mock_repo.get_projects.side_effect = (
-            SqliteInterfaceException("err"))
-        result = await self.service.list_projects(["name"], False, False)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-        self.mock_state.mark_database_failed.assert_called_once()
-
     async def test_list_projects_empty(self):
         self.mock_repo.get_projects.return_value = []
         result = await self.service.list_projects(["name"], False, False)
@@ -141,20 +157,6 @@ class TestProjectService(unittest.IsolatedAsyncioTestCase):
     # create_project
     # ------------------------------------------------------------------
 
-    async def test_create_project_service_unavailable(self):
-        self.mock_state.is_available.return_value = False
-        result = await self.service.create_project("Alpha", "", False)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-
-    async def test_create_project_name_check_db_exception(self):
-        self.mock_repo.project_name_exists.side_effect = (
-            SqliteInterfaceException("err"))
-        result = await self.service.create_project("Alpha", "", False)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-        self.mock_state.mark_database_failed.assert_called_once()
-
     async def test_create_project_name_conflict(self):
         self.mock_repo.project_name_exists.return_value = True
         result = await self.service.create_project("Alpha", "", False)
@@ -187,20 +189,6 @@ class TestProjectService(unittest.IsolatedAsyncioTestCase):
     # modify_project
     # ------------------------------------------------------------------
 
-    async def test_modify_project_service_unavailable(self):
-        self.mock_state.is_available.return_value = False
-        result = await self.service.modify_project(1, "Alpha", "", False)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-
-    async def test_modify_project_get_details_db_exception(self):
-        self.mock_repo.get_project_details.side_effect = (
-            SqliteInterfaceException("err"))
-        result = await self.service.modify_project(1, "Alpha", "", False)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-        self.mock_state.mark_database_failed.assert_called_once()
-
     async def test_modify_project_not_found(self):
         self.mock_repo.get_project_details.return_value = None
         result = await self.service.modify_project(1, "Alpha", "", False)
@@ -261,20 +249,6 @@ class TestProjectService(unittest.IsolatedAsyncioTestCase):
     # delete_project
     # ------------------------------------------------------------------
 
-    async def test_delete_project_service_unavailable(self):
-        self.mock_state.is_available.return_value = False
-        result = await self.service.delete_project(1, False)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-
-    async def test_delete_project_id_check_db_exception(self):
-        self.mock_repo.is_valid_project_id.side_effect = (
-            SqliteInterfaceException("err"))
-        result = await self.service.delete_project(1, False)
-        self.assertFalse(result.success)
-        self.assertTrue(result.is_internal)
-        self.mock_state.mark_database_failed.assert_called_once()
-
     async def test_delete_project_invalid_id(self):
         self.mock_repo.is_valid_project_id.return_value = False
         result = await self.service.delete_project(1, False)
@@ -84,22 +84,19 @@ class TestGetTestcaseHandler(unittest.IsolatedAsyncioTestCase):
         tc = {"id": 10, "folder_id": 1, "name": "Login test",
               "description": "Verify login"}
         self.mock_service.get_testcase.return_value = _ok(data=tc)
-        async with self.client as c:
-            response = await c.get("/testcases/10")
+        response = await self.client.get("/testcases/10")
         self.assertEqual(response.status_code, 200)
         data = await response.get_json()
         self.assertEqual(data["name"], "Login test")
 
     async def test_get_testcase_not_found_returns_404(self):
         self.mock_service.get_testcase.return_value = _not_found()
-        async with self.client as c:
-            response = await c.get("/testcases/99")
+        response = await self.client.get("/testcases/99")
         self.assertEqual(response.status_code, 404)
 
     async def test_get_testcase_internal_error_returns_500(self):
         self.mock_service.get_testcase.return_value = _internal()
-        async with self.client as c:
-            response = await c.get("/testcases/1")
+        response = await self.client.get("/testcases/1")
         self.assertEqual(response.status_code, 500)
 
 
@@ -122,22 +119,19 @@ class TestListTestcasesHandler(unittest.IsolatedAsyncioTestCase):
         self.client = app.test_client()
 
     async def test_list_testcases_missing_project_id_returns_400(self):
-        async with self.client as c:
-            response = await c.get("/testcases")
+        response = await self.client.get("/testcases")
         self.assertEqual(response.status_code, 400)
         self.mock_service.list_testcases.assert_not_called()
 
     async def test_list_testcases_non_integer_project_id_returns_400(self):
-        async with self.client as c:
-            response = await c.get("/testcases?project_id=abc")
+        response = await self.client.get("/testcases?project_id=abc")
         self.assertEqual(response.status_code, 400)
         self.mock_service.list_testcases.assert_not_called()
 
     async def test_list_testcases_success_returns_200(self):
         payload = {"folders": [], "test_cases": [{"id": 1, "name": "TC-1"}]}
         self.mock_service.list_testcases.return_value = _ok(data=payload)
-        async with self.client as c:
-            response = await c.get("/testcases?project_id=3")
+        response = await self.client.get("/testcases?project_id=3")
         self.assertEqual(response.status_code, 200)
         self.mock_service.list_testcases.assert_called_once_with(3)
         data = await response.get_json()
@@ -145,14 +139,12 @@ class TestListTestcasesHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_list_testcases_service_error_returns_500(self):
         self.mock_service.list_testcases.return_value = _internal()
-        async with self.client as c:
-            response = await c.get("/testcases?project_id=3")
+        response = await self.client.get("/testcases?project_id=3")
         self.assertEqual(response.status_code, 500)
 
     async def test_list_testcases_invalid_project_id_returns_404(self):
         self.mock_service.list_testcases.return_value = _not_found()
-        async with self.client as c:
-            response = await c.get("/testcases?project_id=3")
+        response = await self.client.get("/testcases?project_id=3")
         self.assertEqual(response.status_code, 404)
 
 
@@ -175,8 +167,7 @@ class TestAddTestcaseHandler(unittest.IsolatedAsyncioTestCase):
         self.client = app.test_client()
 
     async def _post(self, body):
-        async with self.client as c:
-            return await c.post("/testcases", json=body)
+        return await self.client.post("/testcases", json=body)
 
     async def test_success_returns_200(self):
         self.mock_service.create_testcase.return_value = _ok(data=7)
@@ -234,8 +225,7 @@ class TestModifyTestcaseHandler(unittest.IsolatedAsyncioTestCase):
         self.client = app.test_client()
 
     async def _patch(self, case_id, body):
-        async with self.client as c:
-            return await c.patch(f"/testcases/{case_id}", json=body)
+        return await self.client.patch(f"/testcases/{case_id}", json=body)
 
     async def test_success_returns_200(self):
         self.mock_service.update_testcase.return_value = _ok()
@@ -297,20 +287,17 @@ class TestDeleteTestcaseHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_success_returns_200(self):
         self.mock_service.delete_testcase.return_value = _ok()
-        async with self.client as c:
-            response = await c.delete("/testcases/1")
+        response = await self.client.delete("/testcases/1")
         self.assertEqual(response.status_code, 200)
 
     async def test_not_found_returns_404(self):
         self.mock_service.delete_testcase.return_value = _not_found()
-        async with self.client as c:
-            response = await c.delete("/testcases/99")
+        response = await self.client.delete("/testcases/99")
         self.assertEqual(response.status_code, 404)
 
     async def test_internal_error_returns_500(self):
         self.mock_service.delete_testcase.return_value = _internal()
-        async with self.client as c:
-            response = await c.delete("/testcases/1")
+        response = await self.client.delete("/testcases/1")
         self.assertEqual(response.status_code, 500)
 
 
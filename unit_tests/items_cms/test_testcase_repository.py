@@ -14,6 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import os
+import shutil
 import sqlite3
 import tempfile
 import unittest
@@ -95,13 +96,27 @@ _STRING_TYPE_ID = 1
 class TestTestcaseRepository(unittest.IsolatedAsyncioTestCase):
     """Integration tests for TestcaseRepository against a real SQLite DB."""
 
-    async def asyncSetUp(self):
-        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+    @classmethod
+    def setUpClass(cls):
+        # Build the schema once; each test starts from a copy of it.
+        fd, cls.template_db_path = tempfile.mkstemp(suffix=".db")
         os.close(fd)
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(cls.template_db_path)
         conn.executescript(_SCHEMA_SQL)
         conn.close()
 
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            os.unlink(cls.template_db_path)
+        except OSError:
+            pass
+
+    async def asyncSetUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        shutil.copyfile(self.template_db_path, self.db_path)
+
         mock_config = MagicMock(spec=CMSConfiguration)
         mock_config.backend_db_filename = self.db_path
         self.repo = TestcaseRepository(MagicMock(), mock_config)
@@ -205,10 +220,8 @@ class TestTestcaseRepository(unittest.IsolatedAsyncioTestCase):
         pid = self._insert_project("Alpha")
         fid = self._insert_folder(pid, "Suite A")
         result = await self.repo.get_testcases(pid)
-        self.assertEqual(len(result["folders"]), 1)
-        self.assertEqual(result["folders"][0]["id"], fid)
-        self.assertEqual(result["folders"][0]["name"], "Suite A")
-        self.assertIsNone(result["folders"][0]["parent_id"])
+        self.assertEqual(result["folders"], [
+            {"id": fid, "name": "Suite A", "parent_id": None}])
 
     async def test_get_testcases_returns_nested_folders(self):
         pid = self._insert_project("Alpha")
@@ -224,10 +237,9 @@ class TestTestcaseRepository(unittest.IsolatedAsyncioTestCase):
         fid = self._insert_folder(pid, "Suite A")
         tc_id = self._insert_testcase(pid, "Login Test", folder_id=fid)
         result = await self.repo.get_testcases(pid)
-        self.assertEqual(len(result["test_cases"]), 1)
-        self.assertEqual(result["test_cases"][0]["id"], tc_id)
-        self.assertEqual(result["test_cases"][0]["name"], "Login Test")
-        self.assertEqual(result["test_cases"][0]["folder_id"], fid)
+        self.assertEqual(result["test_cases"], [
+            {"id": tc_id, "folder_id": fid, "name": "Login Test",
+             "custom_fields": []}])
 
     async def test_get_testcases_excludes_other_project_cases(self):
         pid1 = self._insert_project("Alpha")
@@ -308,11 +320,9 @@ class TestTestcaseRepository(unittest.IsolatedAsyncioTestCase):
         pid = self._insert_project("Alpha")
         tc_id = self._insert_testcase(pid, "Login Test", description="Verify login")
         result = await self.repo.get_testcase(tc_id)
-        self.assertIsNotNone(result)
-        self.assertEqual(result["id"], tc_id)
-        self.assertEqual(result["name"], "Login Test")
-        self.assertEqual(result["description"], "Verify login")
-        self.assertIsNone(result["folder_id"])
+        self.assertEqual(result, {"id": tc_id, "folder_id": None,
+                                  "name": "Login Test",
+                                  "description": "Verify login"})
 
     # ------------------------------------------------------------------
     # get_folder_project_id
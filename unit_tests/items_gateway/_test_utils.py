@@ -0,0 +1,40 @@
+"""
+Copyright 2025-2026 Integrated Test Management Suite Development Team
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+from unittest.mock import AsyncMock, Mock
+from quart.testing import QuartClient
+
+# Handlers only read the CMS base URL from the configuration, so a single
+# read-only instance is shared by every handler test.
+CMS_CONFIG = Mock()
+CMS_CONFIG.apis_cms_svc = "http://cms/"
+
+
+class HandlerAppTestCase(unittest.IsolatedAsyncioTestCase):
+    """Serves each test from a module's shared app and client with a freshly
+    reset REST client mock.
+
+    Subclasses set ``rest_client`` to the REST client mock shared by their
+    handlers and ``client`` to a test client of the app serving them. The
+    handlers set no cookies, so a client created with ``use_cookies=False``
+    carries no state between tests and can be reused by all of them.
+    """
+
+    rest_client: AsyncMock
+    client: QuartClient
+
+    async def asyncSetUp(self):
+        self.rest_client.reset_mock(return_value=True, side_effect=True)
@@ -69,15 +69,15 @@ class TestSmtpEmailServiceSend(unittest.IsolatedAsyncioTestCase):
         svc = _make_service()
         with patch("aiosmtplib.send", new_callable=AsyncMock) as mock_send:
             await svc.send("user@example.com", "Subject", "Body text")
-        _, kwargs = mock_send.call_args
         msg = mock_send.call_args[0][0]
         self.assertEqual(msg["To"], "user@example.com")
 
     async def test_send_uses_configured_from_address(self):
         svc = _make_service(from_address="items@example.org")
-        with patch("aiosmtplib.send", new_callable=AsyncMock):
+        with patch("aiosmtplib.send", new_callable=AsyncMock) as mock_send:
             await svc.send("user@example.com", "Subject", "Body")
-        # No assertion needed — just confirming no error raised
+        msg = mock_send.call_args[0][0]
+        self.assertEqual(msg["From"], "items@example.org")
 
     async def test_send_uses_configured_host_and_port(self):
         svc = SmtpEmailService(
@@ -20,109 +20,51 @@ from items.services.items_gateway.gateway_configuration import (
 from items.services.items_gateway.configuration_layout import (
     ConfigurationConstants)
 
+_C = ConfigurationConstants
+
+# (property, section, item, value returned by get_entry) for every
+# configuration property; each must read straight through to its entry.
+_PROPERTY_ENTRIES = [
+    ("logging_log_level",
+     _C.SECTION_LOGGING, _C.LOGGING_LOG_LEVEL, "INFO"),
+    ("general_metadata_config_file",
+     _C.SECTION_GENERAL, _C.GENERAL_METADATA_CONFIG_FILE, "metadata.config"),
+    ("general_api_signing_secret",
+     _C.SECTION_GENERAL, _C.GENERAL_API_SIGNING_SECRET, "secret"),
+    ("apis_identity_svc",
+     _C.SECTION_APIS, _C.APIS_IDENTITY_SVC, "http://localhost:5050/"),
+    ("apis_cms_svc",
+     _C.SECTION_APIS, _C.APIS_CMS_SVC, "http://localhost:6050/"),
+    ("apis_web_portal_svc",
+     _C.SECTION_APIS, _C.APIS_WEB_PORTAL_SVC, "http://localhost:8080/"),
+    ("smtp_host", _C.SECTION_SMTP, _C.SMTP_HOST, "smtp.example.com"),
+    ("smtp_port", _C.SECTION_SMTP, _C.SMTP_PORT, 587),
+    ("smtp_username", _C.SECTION_SMTP, _C.SMTP_USERNAME, "user@example.com"),
+    ("smtp_password", _C.SECTION_SMTP, _C.SMTP_PASSWORD, "s3cr3t"),
+    ("smtp_from_address",
+     _C.SECTION_SMTP, _C.SMTP_FROM_ADDRESS, "noreply@items.local"),
+    ("smtp_use_tls", _C.SECTION_SMTP, _C.SMTP_USE_TLS, True),
+]
+
 
 class TestGatewayConfiguration(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # Properties hold no state of their own, so one instance serves every
+        # test; get_entry is reset before each property is read.
         with patch.object(GatewayConfiguration, "__init__", return_value=None):
-            self.config = GatewayConfiguration()
-        self.config.get_entry = MagicMock()
-
-    def test_logging_log_level(self):
-        self.config.get_entry.return_value = "INFO"
-        result = self.config.logging_log_level
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_LOGGING,
-            ConfigurationConstants.LOGGING_LOG_LEVEL)
-        self.assertEqual(result, "INFO")
-
-    def test_general_metadata_config_file(self):
-        self.config.get_entry.return_value = "metadata.config"
-        result = self.config.general_metadata_config_file
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_GENERAL,
-            ConfigurationConstants.GENERAL_METADATA_CONFIG_FILE)
-        self.assertEqual(result, "metadata.config")
-
-    def test_general_api_signing_secret(self):
-        self.config.get_entry.return_value = "secret"
-        result = self.config.general_api_signing_secret
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_GENERAL,
-            ConfigurationConstants.GENERAL_API_SIGNING_SECRET)
-        self.assertEqual(result, "secret")
-
-    def test_apis_identity_svc(self):
-        self.config.get_entry.return_value = "http://localhost:5050/"
-        result = self.config.apis_identity_svc
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_APIS,
-            ConfigurationConstants.APIS_IDENTITY_SVC)
-        self.assertEqual(result, "http://localhost:5050/")
-
-    def test_apis_cms_svc(self):
-        self.config.get_entry.return_value = "http://localhost:6050/"
-        result = self.config.apis_cms_svc
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_APIS,
-            ConfigurationConstants.APIS_CMS_SVC)
-        self.assertEqual(result, "http://localhost:6050/")
-
-    def test_apis_web_portal_svc(self):
-        self.config.get_entry.return_value = "http://localhost:8080/"
-        result = self.config.apis_web_portal_svc
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_APIS,
-            ConfigurationConstants.APIS_WEB_PORTAL_SVC)
-        self.assertEqual(result, "http://localhost:8080/")
-
-    def test_smtp_host(self):
-        self.config.get_entry.return_value = "smtp.example.com"
-        result = self.config.smtp_host
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_SMTP,
-            ConfigurationConstants.SMTP_HOST)
-        self.assertEqual(result, "smtp.example.com")
-
-    def test_smtp_port(self):
-        self.config.get_entry.return_value = 587
-        result = self.config.smtp_port
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_SMTP,
-            ConfigurationConstants.SMTP_PORT)
-        self.assertEqual(result, 587)
-
-    def test_smtp_username(self):
-        self.config.get_entry.return_value = "user@example.com"
-        result = self.config.smtp_username
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_SMTP,
-            ConfigurationConstants.SMTP_USERNAME)
-        self.assertEqual(result, "user@example.com")
-
-    def test_smtp_password(self):
-        self.config.get_entry.return_value = "s3cr3t"
-        result = self.config.smtp_password
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_SMTP,
-            ConfigurationConstants.SMTP_PASSWORD)
-        self.assertEqual(result, "s3cr3t")
-
-    def test_smtp_from_address(self):
-        self.config.get_entry.return_value = "noreply@items.local"
-        result = self.config.smtp_from_address
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_SMTP,
-            ConfigurationConstants.SMTP_FROM_ADDRESS)
-        self.assertEqual(result, "noreply@items.local")
-
-    def test_smtp_use_tls(self):
-        self.config.get_entry.return_value = True
-        result = self.config.smtp_use_tls
-        self.config.get_entry.assert_called_once_with(
-            ConfigurationConstants.SECTION_SMTP,
-            ConfigurationConstants.SMTP_USE_TLS)
-        self.assertTrue(result)
+            cls.config = GatewayConfiguration()
+        cls.config.get_entry = MagicMock()
+
+    def test_property_maps_to_entry(self):
+        for prop, section, item, value in _PROPERTY_ENTRIES:
+            with self.subTest(prop):
+                self.config.get_entry.reset_mock()
+                self.config.get_entry.return_value = value
+                result = getattr(self.config, prop)
+                self.config.get_entry.assert_called_once_with(section, item)
+                self.assertEqual(result, value)
 
 
 if __name__ == "__main__":
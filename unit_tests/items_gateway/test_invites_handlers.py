@@ -4,7 +4,6 @@ Unit tests for gateway invite management route handlers:
   POST /invites/resend     - ResendInviteHandler
   POST /invites/uninvite   - UninviteHandler
 """
-import json
 import unittest
 from unittest.mock import AsyncMock, MagicMock
 from quart import Quart
@@ -60,7 +59,7 @@ class TestCreateInviteHandler(unittest.IsolatedAsyncioTestCase):
             status_code=201, body={"token": "abc123"})
         resp = await self._post(_EMAIL_BODY)
         self.assertEqual(resp.status_code, 201)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["token"], "abc123")
 
     async def test_body_forwarded_to_identity(self):
@@ -103,7 +102,7 @@ class TestCreateInviteHandler(unittest.IsolatedAsyncioTestCase):
             content_type="text/html")
         resp = await self._post(_EMAIL_BODY)
         self.assertEqual(resp.status_code, 500)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("unexpected response", body["error"])
 
     async def test_response_is_json(self):
@@ -139,7 +138,7 @@ class TestResendInviteHandler(unittest.IsolatedAsyncioTestCase):
             status_code=200, body={"token": "new-token"})
         resp = await self._post(_EMAIL_BODY)
         self.assertEqual(resp.status_code, 200)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["token"], "new-token")
 
     async def test_body_forwarded_to_identity(self):
@@ -174,7 +173,7 @@ class TestResendInviteHandler(unittest.IsolatedAsyncioTestCase):
             content_type="text/html")
         resp = await self._post(_EMAIL_BODY)
         self.assertEqual(resp.status_code, 500)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("unexpected response", body["error"])
 
 
@@ -235,7 +234,7 @@ class TestUninviteHandler(unittest.IsolatedAsyncioTestCase):
             content_type="text/html")
         resp = await self._post(_EMAIL_BODY)
         self.assertEqual(resp.status_code, 500)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("unexpected response", body["error"])
 
 
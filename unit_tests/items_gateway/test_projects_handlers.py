@@ -17,6 +17,7 @@ import unittest
 from unittest.mock import AsyncMock, MagicMock
 from quart import Quart
 from weaver_framework.microservice.api_response import ApiResponse
+from _test_utils import CMS_CONFIG, HandlerAppTestCase
 from items.services.items_gateway.routes.web.projects.add_project_handler \
     import AddProjectHandler
 from items.services.items_gateway.routes.web.projects.delete_project_handler \
@@ -37,47 +38,77 @@ _VALID_PROJECT_BODY = {
 }
 
 
-def _config():
-    config = MagicMock()
-    config.apis_cms_svc = "http://cms/"
-    return config
+# Canned CMS responses shared by the tests. Handlers only read them.
+_CONN_FAILURE = ApiResponse(status_code=None, exception_msg="boom")
+_OK = ApiResponse(status_code=200)
+_OK_EMPTY = ApiResponse(status_code=200, body={})
+_NOT_FOUND = ApiResponse(status_code=404)
+_UNAVAILABLE = ApiResponse(status_code=503)
 
+_REST_CLIENT = AsyncMock()
 
-# ------------------------------------------------------------------
-# AddProjectHandler
-# ------------------------------------------------------------------
 
-class TestAddProjectHandler(unittest.IsolatedAsyncioTestCase):
+def _build_app():
+    """Register every project handler under test on one app, sharing a
+    single mocked REST client."""
+    args = (_LOGGER, CMS_CONFIG, _REST_CLIENT)
+    add_handler = AddProjectHandler(*args)
+    delete_handler = DeleteProjectHandler(*args)
+    get_all_handler = GetAllProjectsHandler(*args)
+    get_handler = GetProjectHandler(*args)
+    update_handler = UpdateProjectHandler(*args)
+
+    app = Quart(__name__)
+
+    @app.route("/projects", methods=["POST"])
+    async def add_project():
+        return await add_handler.add_project()
+
+    @app.route("/projects/<int:project_id>", methods=["DELETE"])
+    async def delete_project(project_id):
+        return await delete_handler.delete_project(project_id)
+
+    @app.route("/projects", methods=["GET"])
+    async def list_projects():
+        return await get_all_handler.list_all_projects()
 
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = AddProjectHandler(_LOGGER, _config(), self.mock_rest_client)
+    @app.route("/projects/<int:project_id>", methods=["GET"])
+    async def get_project(project_id):
+        return await get_handler.get_project(project_id)
 
-        app = Quart(__name__)
+    @app.route("/projects/<int:project_id>", methods=["PATCH"])
+    async def update_project(project_id):
+        return await update_handler.update_project(project_id)
 
-        @app.route("/projects", methods=["POST"])
-        async def add_project():
-            return await handler.add_project()
+    return app
+
+
+class _ProjectHandlerTestCase(HandlerAppTestCase):
+    rest_client = _REST_CLIENT
+    client = _build_app().test_client(use_cookies=False)
+
+
+# ------------------------------------------------------------------
+# AddProjectHandler
+# ------------------------------------------------------------------
 
-        self.client = app.test_client()
+class TestAddProjectHandler(_ProjectHandlerTestCase):
 
     async def _post(self, body):
-        async with self.client as c:
-            return await c.post("/projects", json=body)
+        return await self.client.post("/projects", json=body)
 
     async def test_missing_field_returns_400(self):
         response = await self._post({"name": "X"})
         self.assertEqual(response.status_code, 400)
-        self.mock_rest_client.post.assert_not_called()
+        self.rest_client.post.assert_not_called()
 
     async def test_connection_failure_returns_500(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
-            status_code=None, exception_msg="boom")
+        self.rest_client.post.return_value = _CONN_FAILURE
         response = await self._post(_VALID_PROJECT_BODY)
         self.assertEqual(response.status_code, 500)
 
     async def test_cms_bad_request_returns_400(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
+        self.rest_client.post.return_value = ApiResponse(
             status_code=400, body={"error": "duplicate name"})
         response = await self._post(_VALID_PROJECT_BODY)
         self.assertEqual(response.status_code, 400)
@@ -85,12 +116,12 @@ class TestAddProjectHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(data["error"], "duplicate name")
 
     async def test_cms_other_error_returns_500(self):
-        self.mock_rest_client.post.return_value = ApiResponse(status_code=503)
+        self.rest_client.post.return_value = _UNAVAILABLE
         response = await self._post(_VALID_PROJECT_BODY)
         self.assertEqual(response.status_code, 500)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.post.return_value = ApiResponse(status_code=200)
+        self.rest_client.post.return_value = _OK
         response = await self._post(_VALID_PROJECT_BODY)
         self.assertEqual(response.status_code, 200)
         data = await response.get_json()
@@ -101,58 +132,43 @@ class TestAddProjectHandler(unittest.IsolatedAsyncioTestCase):
 # DeleteProjectHandler
 # ------------------------------------------------------------------
 
-class TestDeleteProjectHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = DeleteProjectHandler(_LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/projects/<int:project_id>", methods=["DELETE"])
-        async def delete_project(project_id):
-            return await handler.delete_project(project_id)
-
-        self.client = app.test_client()
+class TestDeleteProjectHandler(_ProjectHandlerTestCase):
 
     async def _delete(self, qs=""):
-        async with self.client as c:
-            return await c.delete(f"/projects/1{qs}")
+        return await self.client.delete(f"/projects/1{qs}")
 
     async def test_default_soft_delete(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(
-            status_code=200, body={})
+        self.rest_client.delete.return_value = _OK_EMPTY
         response = await self._delete()
         self.assertEqual(response.status_code, 200)
-        called_url = self.mock_rest_client.delete.call_args[0][0]
+        called_url = self.rest_client.delete.call_args[0][0]
         self.assertIn("hard_delete=false", called_url)
 
     async def test_invalid_hard_delete_value_returns_500(self):
         response = await self._delete("?hard_delete=maybe")
         self.assertEqual(response.status_code, 500)
-        self.mock_rest_client.delete.assert_not_called()
+        self.rest_client.delete.assert_not_called()
 
     async def test_hard_delete_true(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(
-            status_code=200, body={})
+        self.rest_client.delete.return_value = _OK_EMPTY
         response = await self._delete("?hard_delete=true")
         self.assertEqual(response.status_code, 200)
-        called_url = self.mock_rest_client.delete.call_args[0][0]
+        called_url = self.rest_client.delete.call_args[0][0]
         self.assertIn("hard_delete=True", called_url)
 
     async def test_not_found_propagates_404(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(
+        self.rest_client.delete.return_value = ApiResponse(
             status_code=404, body={"error": "no such project"})
         response = await self._delete()
         self.assertEqual(response.status_code, 404)
 
     async def test_other_error_returns_500(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(status_code=503)
+        self.rest_client.delete.return_value = _UNAVAILABLE
         response = await self._delete()
         self.assertEqual(response.status_code, 500)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(
+        self.rest_client.delete.return_value = ApiResponse(
             status_code=200, body={"status": 1})
         response = await self._delete()
         self.assertEqual(response.status_code, 200)
@@ -162,62 +178,46 @@ class TestDeleteProjectHandler(unittest.IsolatedAsyncioTestCase):
 # GetAllProjectsHandler
 # ------------------------------------------------------------------
 
-class TestGetAllProjectsHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = GetAllProjectsHandler(_LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/projects", methods=["GET"])
-        async def list_projects():
-            return await handler.list_all_projects()
-
-        self.client = app.test_client()
+class TestGetAllProjectsHandler(_ProjectHandlerTestCase):
 
     async def _get(self, qs=""):
-        async with self.client as c:
-            return await c.get(f"/projects{qs}")
+        return await self.client.get(f"/projects{qs}")
 
     async def test_no_query_params(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=200, body={"projects": []})
         response = await self._get()
         self.assertEqual(response.status_code, 200)
 
     async def test_value_fields_only(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
-            status_code=200, body={})
+        self.rest_client.get.return_value = _OK_EMPTY
         response = await self._get("?value_fields=name")
         self.assertEqual(response.status_code, 200)
-        called_url = self.mock_rest_client.get.call_args[0][0]
+        called_url = self.rest_client.get.call_args[0][0]
         self.assertIn("value_fields=name", called_url)
 
     async def test_count_fields_only(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
-            status_code=200, body={})
+        self.rest_client.get.return_value = _OK_EMPTY
         response = await self._get("?count_fields=testcases")
         self.assertEqual(response.status_code, 200)
-        called_url = self.mock_rest_client.get.call_args[0][0]
+        called_url = self.rest_client.get.call_args[0][0]
         self.assertIn("count_fields=testcases", called_url)
 
     async def test_both_value_and_count_fields(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
-            status_code=200, body={})
+        self.rest_client.get.return_value = _OK_EMPTY
         response = await self._get("?value_fields=name&count_fields=testcases")
         self.assertEqual(response.status_code, 200)
-        called_url = self.mock_rest_client.get.call_args[0][0]
+        called_url = self.rest_client.get.call_args[0][0]
         self.assertIn("value_fields=name&count_fields=testcases", called_url)
 
     async def test_bad_request_returns_400(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=400, body={"error": "bad field"})
         response = await self._get()
         self.assertEqual(response.status_code, 400)
 
     async def test_other_error_returns_500(self):
-        self.mock_rest_client.get.return_value = ApiResponse(status_code=503)
+        self.rest_client.get.return_value = _UNAVAILABLE
         response = await self._get()
         self.assertEqual(response.status_code, 500)
 
@@ -226,42 +226,26 @@ class TestGetAllProjectsHandler(unittest.IsolatedAsyncioTestCase):
 # GetProjectHandler
 # ------------------------------------------------------------------
 
-class TestGetProjectHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = GetProjectHandler(_LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/projects/<int:project_id>", methods=["GET"])
-        async def get_project(project_id):
-            return await handler.get_project(project_id)
-
-        self.client = app.test_client()
+class TestGetProjectHandler(_ProjectHandlerTestCase):
 
     async def _get(self):
-        async with self.client as c:
-            return await c.get("/projects/1")
-
-    async def test_not_found_returns_404(self):
-        self.mock_rest_client.get.return_value = ApiResponse(status_code=404)
-        response = await self._get()
-        self.assertEqual(response.status_code, 404)
-
-    async def test_internal_server_error_returns_500(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
-            status_code=500, body={"error": "db error"})
-        response = await self._get()
-        self.assertEqual(response.status_code, 500)
-
-    async def test_other_error_returns_500(self):
-        self.mock_rest_client.get.return_value = ApiResponse(status_code=503)
-        response = await self._get()
-        self.assertEqual(response.status_code, 500)
+        return await self.client.get("/projects/1")
+
+    async def test_cms_error_status_mapping(self):
+        # (CMS response, expected gateway status)
+        cases = [
+            (_NOT_FOUND, 404),
+            (ApiResponse(status_code=500, body={"error": "db error"}), 500),
+            (_UNAVAILABLE, 500),
+        ]
+        for cms_response, expected in cases:
+            with self.subTest(cms_status=cms_response.status_code):
+                self.rest_client.get.return_value = cms_response
+                response = await self._get()
+                self.assertEqual(response.status_code, expected)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=200, body={"id": 1})
         response = await self._get()
         self.assertEqual(response.status_code, 200)
@@ -271,55 +255,39 @@ class TestGetProjectHandler(unittest.IsolatedAsyncioTestCase):
 # UpdateProjectHandler
 # ------------------------------------------------------------------
 
-class TestUpdateProjectHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = UpdateProjectHandler(_LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/projects/<int:project_id>", methods=["PATCH"])
-        async def update_project(project_id):
-            return await handler.update_project(project_id)
-
-        self.client = app.test_client()
+class TestUpdateProjectHandler(_ProjectHandlerTestCase):
 
     async def _patch(self, body):
-        async with self.client as c:
-            return await c.patch("/projects/1", json=body)
+        return await self.client.patch("/projects/1", json=body)
 
     async def test_missing_field_returns_400(self):
         response = await self._patch({"name": "X"})
         self.assertEqual(response.status_code, 400)
-        self.mock_rest_client.patch.assert_not_called()
-
-    async def test_not_found_returns_404(self):
-        self.mock_rest_client.patch.return_value = ApiResponse(status_code=404)
-        response = await self._patch(_VALID_PROJECT_BODY)
-        self.assertEqual(response.status_code, 404)
-
-    async def test_bad_request_returns_400(self):
-        self.mock_rest_client.patch.return_value = ApiResponse(
-            status_code=400, body={"error": "duplicate name"})
-        response = await self._patch(_VALID_PROJECT_BODY)
-        self.assertEqual(response.status_code, 400)
-
-    async def test_internal_server_error_returns_500(self):
-        self.mock_rest_client.patch.return_value = ApiResponse(
-            status_code=500, exception_msg="db error")
-        response = await self._patch(_VALID_PROJECT_BODY)
-        self.assertEqual(response.status_code, 500)
+        self.rest_client.patch.assert_not_called()
+
+    async def test_cms_error_status_mapping(self):
+        # (CMS response, expected gateway status)
+        cases = [
+            (_NOT_FOUND, 404),
+            (ApiResponse(status_code=400, body={"error": "duplicate name"}),
+             400),
+            (ApiResponse(status_code=500, exception_msg="db error"), 500),
+        ]
+        for cms_response, expected in cases:
+            with self.subTest(cms_status=cms_response.status_code):
+                self.rest_client.patch.return_value = cms_response
+                response = await self._patch(_VALID_PROJECT_BODY)
+                self.assertEqual(response.status_code, expected)
 
     async def test_unexpected_status_returns_500(self):
-        self.mock_rest_client.patch.return_value = ApiResponse(status_code=503)
+        self.rest_client.patch.return_value = _UNAVAILABLE
         response = await self._patch(_VALID_PROJECT_BODY)
         self.assertEqual(response.status_code, 500)
         data = await response.get_json()
         self.assertEqual(data["status"], 0)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.patch.return_value = ApiResponse(status_code=200)
+        self.rest_client.patch.return_value = _OK
         response = await self._patch(_VALID_PROJECT_BODY)
         self.assertEqual(response.status_code, 200)
         data = await response.get_json()
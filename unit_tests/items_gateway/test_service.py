@@ -92,33 +92,36 @@ class TestServiceInitialise(unittest.IsolatedAsyncioTestCase):
             new_callable=PropertyMock,
             return_value=self.mock_bm_logger)
         self._logger_patcher.start()
+        self.addCleanup(self._logger_patcher.stop)
 
         self._session_patcher = patch(
             "items.services.items_gateway.service.aiohttp.ClientSession",
             return_value=MagicMock())
         self._session_patcher.start()
+        self.addCleanup(self._session_patcher.stop)
 
         self._metadata_handler_cls_patcher = patch(
             "items.services.items_gateway.service.MetadataHandler")
         self.mock_metadata_handler_cls = self._metadata_handler_cls_patcher.start()
+        self.addCleanup(self._metadata_handler_cls_patcher.stop)
         self.mock_metadata_handler_cls.return_value.read_metadata_file.\
             return_value = True
 
         self._web_portal_client_patcher = patch(
             "items.services.items_gateway.service.WebPortalClient")
         self._web_portal_client_patcher.start()
+        self.addCleanup(self._web_portal_client_patcher.stop)
 
         self._rest_client_patcher = patch(
             "items.services.items_gateway.service.RestClient")
         self._rest_client_patcher.start()
+        self.addCleanup(self._rest_client_patcher.stop)
 
         self._create_routes_patcher = patch(
             "items.services.items_gateway.service.create_routes",
             return_value=MagicMock())
         self._create_routes_patcher.start()
-
-    async def asyncTearDown(self):
-        patch.stopall()
+        self.addCleanup(self._create_routes_patcher.stop)
 
     async def test_initialise_returns_false_when_manage_configuration_fails(self):
         with patch.object(self.service, '_manage_configuration',
@@ -31,6 +31,17 @@ _LOGGER = MagicMock()
 _VALID_TOKEN = "a" * 32
 
 
+def _login_responses(profile):
+    """Identity responses for a successful password check followed by the
+    profile lookup, in the order NewSessionPasswordHandler posts them."""
+    return [ApiResponse(status_code=200), profile]
+
+
+def _profile(is_administrator=False):
+    return ApiResponse(status_code=200,
+                       body={"is_administrator": is_administrator})
+
+
 # ------------------------------------------------------------------
 # NewSessionPasswordHandler
 # ------------------------------------------------------------------
@@ -83,10 +94,8 @@ class TestNewSessionPasswordHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_success_new_login(self):
         self.mock_sessions.has_session.return_value = False
-        self.mock_rest_client.post.side_effect = [
-            ApiResponse(status_code=200),
-            ApiResponse(status_code=200, body={"is_administrator": False})
-        ]
+        self.mock_rest_client.post.side_effect = _login_responses(
+            _profile(is_administrator=False))
         response = await self._post(
             {"email_address": "a@b.com", "password": "password1"})
         self.assertEqual(response.status_code, 200)
@@ -96,10 +105,8 @@ class TestNewSessionPasswordHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_success_relogin(self):
         self.mock_sessions.has_session.return_value = True
-        self.mock_rest_client.post.side_effect = [
-            ApiResponse(status_code=200),
-            ApiResponse(status_code=200, body={"is_administrator": False})
-        ]
+        self.mock_rest_client.post.side_effect = _login_responses(
+            _profile(is_administrator=False))
         response = await self._post(
             {"email_address": "a@b.com", "password": "password1"})
         self.assertEqual(response.status_code, 200)
@@ -107,10 +114,8 @@ class TestNewSessionPasswordHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_success_stores_is_administrator_true(self):
         self.mock_sessions.has_session.return_value = False
-        self.mock_rest_client.post.side_effect = [
-            ApiResponse(status_code=200),
-            ApiResponse(status_code=200, body={"is_administrator": True})
-        ]
+        self.mock_rest_client.post.side_effect = _login_responses(
+            _profile(is_administrator=True))
         await self._post({"email_address": "a@b.com", "password": "password1"})
         args, kwargs = self.mock_sessions.add_session.call_args
         # is_administrator may be passed positionally (index 3) or as a kwarg
@@ -119,10 +124,8 @@ class TestNewSessionPasswordHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_profile_fetch_failure_defaults_is_administrator_false(self):
         self.mock_sessions.has_session.return_value = False
-        self.mock_rest_client.post.side_effect = [
-            ApiResponse(status_code=200),
-            ApiResponse(status_code=503)
-        ]
+        self.mock_rest_client.post.side_effect = _login_responses(
+            ApiResponse(status_code=503))
         response = await self._post(
             {"email_address": "a@b.com", "password": "password1"})
         self.assertEqual(response.status_code, 200)
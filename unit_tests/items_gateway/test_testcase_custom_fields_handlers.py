@@ -17,6 +17,7 @@ import unittest
 from unittest.mock import AsyncMock, MagicMock
 from quart import Quart
 from weaver_framework.microservice.api_response import ApiResponse
+from _test_utils import CMS_CONFIG, HandlerAppTestCase
 from items.services.items_gateway.routes.web.testcase_custom_fields.\
     add_custom_field_handler import AddCustomFieldHandler
 from items.services.items_gateway.routes.web.testcase_custom_fields.\
@@ -44,69 +45,101 @@ _VALID_FIELD_BODY = {
 }
 
 
-def _config():
-    config = MagicMock()
-    config.apis_cms_svc = "http://cms/"
-    return config
+# Canned CMS responses shared by the tests. Handlers only read them.
+_CONN_FAILURE = ApiResponse(status_code=None, exception_msg="boom")
+_OK = ApiResponse(status_code=200)
+_NOT_FOUND = ApiResponse(status_code=404)
 
+_REST_CLIENT = AsyncMock()
 
-# ------------------------------------------------------------------
-# GetAllCustomFieldsHandler
-# ------------------------------------------------------------------
 
-class TestGetAllCustomFieldsHandler(unittest.IsolatedAsyncioTestCase):
+def _build_app():
+    """Register every custom field handler under test on one app, sharing a
+    single mocked REST client."""
+    args = (_LOGGER, CMS_CONFIG, _REST_CLIENT)
+    get_all_handler = GetAllCustomFieldsHandler(*args)
+    get_handler = GetCustomFieldHandler(*args)
+    add_handler = AddCustomFieldHandler(*args)
+    delete_handler = DeleteCustomFieldHandler(*args)
+    modify_handler = ModifyCustomFieldHandler(*args)
+    move_handler = MoveCustomFieldHandler(*args)
+
+    app = Quart(__name__)
+
+    @app.route("/testcase_custom_fields", methods=["GET"])
+    async def get_all_custom_fields():
+        return await get_all_handler.get_all_custom_fields()
+
+    @app.route("/testcase_custom_fields/<int:field_id>", methods=["GET"])
+    async def get_custom_field(field_id):
+        return await get_handler.get_custom_field(field_id)
+
+    @app.route("/testcase_custom_fields", methods=["POST"])
+    async def add_custom_field():
+        return await add_handler.add_custom_field()
+
+    @app.route("/testcase_custom_fields/<int:field_id>", methods=["DELETE"])
+    async def delete_custom_field(field_id):
+        return await delete_handler.delete_custom_field(field_id)
+
+    @app.route("/testcase_custom_fields/<int:field_id>", methods=["PUT"])
+    async def modify_custom_field(field_id):
+        return await modify_handler.modify_custom_field(field_id)
 
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = GetAllCustomFieldsHandler(
-            _LOGGER, _config(), self.mock_rest_client)
+    @app.route("/testcase_custom_fields/<int:field_id>", methods=["PATCH"])
+    async def move_custom_field(field_id):
+        return await move_handler.move_custom_field(field_id)
 
-        app = Quart(__name__)
+    return app
 
-        @app.route("/testcase_custom_fields", methods=["GET"])
-        async def get_all_custom_fields():
-            return await handler.get_all_custom_fields()
 
-        self.client = app.test_client()
+class _CustomFieldHandlerTestCase(HandlerAppTestCase):
+    rest_client = _REST_CLIENT
+    client = _build_app().test_client(use_cookies=False)
+
+
+# ------------------------------------------------------------------
+# GetAllCustomFieldsHandler
+# ------------------------------------------------------------------
+
+class TestGetAllCustomFieldsHandler(_CustomFieldHandlerTestCase):
 
     async def _get(self, qs=""):
-        async with self.client as c:
-            return await c.get(f"/testcase_custom_fields{qs}")
+        return await self.client.get(f"/testcase_custom_fields{qs}")
 
     async def test_non_integer_project_id_returns_400(self):
         response = await self._get("?project_id=abc")
         self.assertEqual(response.status_code, 400)
-        self.mock_rest_client.get.assert_not_called()
+        self.rest_client.get.assert_not_called()
 
     async def test_non_positive_project_id_returns_400(self):
         response = await self._get("?project_id=0")
         self.assertEqual(response.status_code, 400)
-        self.mock_rest_client.get.assert_not_called()
+        self.rest_client.get.assert_not_called()
 
     async def test_no_project_id_lists_all(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=200, body=[])
         response = await self._get()
         self.assertEqual(response.status_code, 200)
-        _, kwargs = self.mock_rest_client.get.call_args
+        _, kwargs = self.rest_client.get.call_args
         self.assertIsNone(kwargs.get("params"))
 
     async def test_valid_project_id_passed_through(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=200, body=[])
         response = await self._get("?project_id=5")
         self.assertEqual(response.status_code, 200)
-        _, kwargs = self.mock_rest_client.get.call_args
+        _, kwargs = self.rest_client.get.call_args
         self.assertEqual(kwargs.get("params"), {"project_id": 5})
 
     async def test_connection_failure_returns_500(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
-            status_code=None, exception_msg="boom")
+        self.rest_client.get.return_value = _CONN_FAILURE
         response = await self._get()
         self.assertEqual(response.status_code, 500)
 
     async def test_cms_error_status_propagated(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=404, body={"error": "Project id is invalid"})
         response = await self._get("?project_id=999")
         self.assertEqual(response.status_code, 404)
@@ -116,46 +149,31 @@ class TestGetAllCustomFieldsHandler(unittest.IsolatedAsyncioTestCase):
 # GetCustomFieldHandler
 # ------------------------------------------------------------------
 
-class TestGetCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = GetCustomFieldHandler(
-            _LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/testcase_custom_fields/<int:field_id>", methods=["GET"])
-        async def get_custom_field(field_id):
-            return await handler.get_custom_field(field_id)
-
-        self.client = app.test_client()
+class TestGetCustomFieldHandler(_CustomFieldHandlerTestCase):
 
     async def _get(self, field_id=1):
-        async with self.client as c:
-            return await c.get(f"/testcase_custom_fields/{field_id}")
+        return await self.client.get(f"/testcase_custom_fields/{field_id}")
 
     async def test_connection_failure_returns_500(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
-            status_code=None, exception_msg="boom")
+        self.rest_client.get.return_value = _CONN_FAILURE
         response = await self._get()
         self.assertEqual(response.status_code, 500)
 
     async def test_not_found_returns_404(self):
-        self.mock_rest_client.get.return_value = ApiResponse(status_code=404)
+        self.rest_client.get.return_value = _NOT_FOUND
         response = await self._get(99)
         self.assertEqual(response.status_code, 404)
         data = await response.get_json()
         self.assertIn("99", data["error"])
 
     async def test_other_error_status_propagated(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=400, body={"error": "bad"})
         response = await self._get()
         self.assertEqual(response.status_code, 400)
 
     async def test_other_error_status_non_dict_body(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=500, body="not a dict")
         response = await self._get()
         self.assertEqual(response.status_code, 500)
@@ -164,7 +182,7 @@ class TestGetCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_success_returns_200(self):
         field = {"id": 1, "field_name": "Priority"}
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=200, body=field)
         response = await self._get()
         self.assertEqual(response.status_code, 200)
@@ -176,38 +194,24 @@ class TestGetCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
 # AddCustomFieldHandler
 # ------------------------------------------------------------------
 
-class TestAddCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = AddCustomFieldHandler(_LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/testcase_custom_fields", methods=["POST"])
-        async def add_custom_field():
-            return await handler.add_custom_field()
-
-        self.client = app.test_client()
+class TestAddCustomFieldHandler(_CustomFieldHandlerTestCase):
 
     async def _post(self, body):
-        async with self.client as c:
-            return await c.post("/testcase_custom_fields", json=body)
+        return await self.client.post("/testcase_custom_fields", json=body)
 
     async def test_missing_field_returns_400(self):
         body = {k: v for k, v in _VALID_FIELD_BODY.items() if k != "field_name"}
         response = await self._post(body)
         self.assertEqual(response.status_code, 400)
-        self.mock_rest_client.post.assert_not_called()
+        self.rest_client.post.assert_not_called()
 
     async def test_connection_failure_returns_500(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
-            status_code=None, exception_msg="boom")
+        self.rest_client.post.return_value = _CONN_FAILURE
         response = await self._post(_VALID_FIELD_BODY)
         self.assertEqual(response.status_code, 500)
 
     async def test_cms_error_status_propagated_dict_body(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
+        self.rest_client.post.return_value = ApiResponse(
             status_code=409, body={"error": "already exists"})
         response = await self._post(_VALID_FIELD_BODY)
         self.assertEqual(response.status_code, 409)
@@ -215,7 +219,7 @@ class TestAddCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(data["error"], "already exists")
 
     async def test_cms_error_status_non_dict_body(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
+        self.rest_client.post.return_value = ApiResponse(
             status_code=500, body="not a dict")
         response = await self._post(_VALID_FIELD_BODY)
         self.assertEqual(response.status_code, 500)
@@ -223,7 +227,7 @@ class TestAddCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(data["error"], "Unknown error")
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.post.return_value = ApiResponse(status_code=200)
+        self.rest_client.post.return_value = _OK
         response = await self._post(_VALID_FIELD_BODY)
         self.assertEqual(response.status_code, 200)
         data = await response.get_json()
@@ -234,47 +238,32 @@ class TestAddCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
 # DeleteCustomFieldHandler
 # ------------------------------------------------------------------
 
-class TestDeleteCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = DeleteCustomFieldHandler(
-            _LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/testcase_custom_fields/<int:field_id>", methods=["DELETE"])
-        async def delete_custom_field(field_id):
-            return await handler.delete_custom_field(field_id)
-
-        self.client = app.test_client()
+class TestDeleteCustomFieldHandler(_CustomFieldHandlerTestCase):
 
     async def _delete(self, field_id=1):
-        async with self.client as c:
-            return await c.delete(f"/testcase_custom_fields/{field_id}")
+        return await self.client.delete(f"/testcase_custom_fields/{field_id}")
 
     async def test_connection_failure_returns_500(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(
-            status_code=None, exception_msg="boom")
+        self.rest_client.delete.return_value = _CONN_FAILURE
         response = await self._delete()
         self.assertEqual(response.status_code, 500)
 
     async def test_not_found_returns_404(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(status_code=404)
+        self.rest_client.delete.return_value = _NOT_FOUND
         response = await self._delete(99)
         self.assertEqual(response.status_code, 404)
         data = await response.get_json()
         self.assertIn("99", data["error"])
 
     async def test_other_error_status_propagated(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(
+        self.rest_client.delete.return_value = ApiResponse(
             status_code=400, body={"error": "System custom fields cannot be "
                                             "deleted"})
         response = await self._delete()
         self.assertEqual(response.status_code, 400)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.delete.return_value = ApiResponse(status_code=200)
+        self.rest_client.delete.return_value = _OK
         response = await self._delete()
         self.assertEqual(response.status_code, 200)
         data = await response.get_json()
@@ -285,39 +274,26 @@ class TestDeleteCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
 # ModifyCustomFieldHandler
 # ------------------------------------------------------------------
 
-class TestModifyCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = ModifyCustomFieldHandler(
-            _LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/testcase_custom_fields/<int:field_id>", methods=["PUT"])
-        async def modify_custom_field(field_id):
-            return await handler.modify_custom_field(field_id)
-
-        self.client = app.test_client()
+class TestModifyCustomFieldHandler(_CustomFieldHandlerTestCase):
 
     async def _put(self, field_id, body):
-        async with self.client as c:
-            return await c.put(f"/testcase_custom_fields/{field_id}", json=body)
+        return await self.client.put(f"/testcase_custom_fields/{field_id}",
+                                     json=body)
 
     async def test_missing_field_returns_400(self):
         body = {k: v for k, v in _VALID_FIELD_BODY.items() if k != "system_name"}
         response = await self._put(1, body)
         self.assertEqual(response.status_code, 400)
-        self.mock_rest_client.put.assert_not_called()
+        self.rest_client.put.assert_not_called()
 
     async def test_error_status_propagated(self):
-        self.mock_rest_client.put.return_value = ApiResponse(
+        self.rest_client.put.return_value = ApiResponse(
             status_code=404, body={"error": "not found"})
         response = await self._put(99, _VALID_FIELD_BODY)
         self.assertEqual(response.status_code, 404)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.put.return_value = ApiResponse(status_code=200)
+        self.rest_client.put.return_value = _OK
         response = await self._put(1, _VALID_FIELD_BODY)
         self.assertEqual(response.status_code, 200)
         data = await response.get_json()
@@ -328,45 +304,30 @@ class TestModifyCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
 # MoveCustomFieldHandler
 # ------------------------------------------------------------------
 
-class TestMoveCustomFieldHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = MoveCustomFieldHandler(
-            _LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/testcase_custom_fields/<int:field_id>", methods=["PATCH"])
-        async def move_custom_field(field_id):
-            return await handler.move_custom_field(field_id)
-
-        self.client = app.test_client()
+class TestMoveCustomFieldHandler(_CustomFieldHandlerTestCase):
 
     async def _patch(self, field_id, body):
-        async with self.client as c:
-            return await c.patch(f"/testcase_custom_fields/{field_id}",
-                                 json=body)
+        return await self.client.patch(f"/testcase_custom_fields/{field_id}",
+                                       json=body)
 
     async def test_missing_direction_returns_400(self):
         response = await self._patch(1, {})
         self.assertEqual(response.status_code, 400)
-        self.mock_rest_client.patch.assert_not_called()
+        self.rest_client.patch.assert_not_called()
 
     async def test_connection_failure_returns_500(self):
-        self.mock_rest_client.patch.return_value = ApiResponse(
-            status_code=None, exception_msg="boom")
+        self.rest_client.patch.return_value = _CONN_FAILURE
         response = await self._patch(1, {"direction": "up"})
         self.assertEqual(response.status_code, 500)
 
     async def test_error_status_propagated(self):
-        self.mock_rest_client.patch.return_value = ApiResponse(
+        self.rest_client.patch.return_value = ApiResponse(
             status_code=400, body={"error": "already at the boundary"})
         response = await self._patch(1, {"direction": "up"})
         self.assertEqual(response.status_code, 400)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.patch.return_value = ApiResponse(status_code=200)
+        self.rest_client.patch.return_value = _OK
         response = await self._patch(1, {"direction": "down"})
         self.assertEqual(response.status_code, 200)
         data = await response.get_json()
@@ -14,47 +14,81 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import unittest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, Mock
 from quart import Quart
 from weaver_framework.microservice.api_response import ApiResponse
+from _test_utils import CMS_CONFIG, HandlerAppTestCase
 from items.services.items_gateway.routes.web.testcases.get_testcase_handler \
     import GetTestcaseHandler
 from items.services.items_gateway.routes.web.testcases.get_testcases_handler \
     import GetTestcasesHandler
 
-_LOGGER = MagicMock()
+_LOGGER = Mock()
 
+# Response bodies in the shape the CMS testcase endpoints return them, shared
+# by the success tests so each one checks the full payload is passed through.
+_CMS_TESTCASE = {
+    "id": 1,
+    "folder_id": 2,
+    "name": "Login test",
+    "description": "Verify login with valid credentials",
+}
 
-def _config():
-    config = MagicMock()
-    config.apis_cms_svc = "http://cms/"
-    return config
+_CMS_TESTCASES = {
+    "folders": [
+        {"id": 1, "name": "Functional Tests", "parent_id": None},
+        {"id": 2, "name": "Login", "parent_id": 1},
+    ],
+    "test_cases": [
+        {"id": 4, "folder_id": 2, "name": "Valid Login Test",
+         "custom_fields": [
+             {"field_id": 1, "field_name": "Priority",
+              "field_type": "Dropdown", "position": 1, "value": "High"},
+         ]},
+        {"id": 5, "folder_id": 2, "name": "Invalid Login Test",
+         "custom_fields": []},
+    ],
+}
 
+_REST_CLIENT = AsyncMock()
 
-# ------------------------------------------------------------------
-# GetTestcaseHandler
-# ------------------------------------------------------------------
 
-class TestGetTestcaseHandler(unittest.IsolatedAsyncioTestCase):
+def _build_app():
+    """Register both testcase handlers on one app, sharing a single mocked
+    REST client."""
+    args = (_LOGGER, CMS_CONFIG, _REST_CLIENT)
+    get_handler = GetTestcaseHandler(*args)
+    get_all_handler = GetTestcasesHandler(*args)
+
+    app = Quart(__name__)
+
+    @app.route("/testcases/<int:case_id>", methods=["GET"])
+    async def get_testcase(case_id):
+        return await get_handler.get_testcase(case_id)
+
+    @app.route("/<int:project_id>/testcases", methods=["GET"])
+    async def get_testcases(project_id):
+        return await get_all_handler.get_testcases(project_id)
+
+    return app
+
 
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = GetTestcaseHandler(_LOGGER, _config(), self.mock_rest_client)
+class _TestcaseHandlerTestCase(HandlerAppTestCase):
+    rest_client = _REST_CLIENT
+    client = _build_app().test_client(use_cookies=False)
 
-        app = Quart(__name__)
 
-        @app.route("/testcases/<int:case_id>", methods=["GET"])
-        async def get_testcase(case_id):
-            return await handler.get_testcase(case_id)
+# ------------------------------------------------------------------
+# GetTestcaseHandler
+# ------------------------------------------------------------------
 
-        self.client = app.test_client()
+class TestGetTestcaseHandler(_TestcaseHandlerTestCase):
 
     async def _get(self):
-        async with self.client as c:
-            return await c.get("/testcases/1")
+        return await self.client.get("/testcases/1")
 
     async def test_not_found_returns_404(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=404, body={"error": "Test case not found"})
         response = await self._get()
         self.assertEqual(response.status_code, 404)
@@ -62,43 +96,29 @@ class TestGetTestcaseHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(data["error"], "Test case not found")
 
     async def test_other_error_returns_500(self):
-        self.mock_rest_client.get.return_value = ApiResponse(status_code=503)
+        self.rest_client.get.return_value = ApiResponse(status_code=503)
         response = await self._get()
         self.assertEqual(response.status_code, 500)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
-            status_code=200, body={"id": 1, "name": "Login test"})
+        self.rest_client.get.return_value = ApiResponse(
+            status_code=200, body=_CMS_TESTCASE)
         response = await self._get()
         self.assertEqual(response.status_code, 200)
-        data = await response.get_json()
-        self.assertEqual(data["name"], "Login test")
+        self.assertEqual(await response.get_json(), _CMS_TESTCASE)
 
 
 # ------------------------------------------------------------------
 # GetTestcasesHandler
 # ------------------------------------------------------------------
 
-class TestGetTestcasesHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        handler = GetTestcasesHandler(_LOGGER, _config(), self.mock_rest_client)
-
-        app = Quart(__name__)
-
-        @app.route("/<int:project_id>/testcases", methods=["GET"])
-        async def get_testcases(project_id):
-            return await handler.get_testcases(project_id)
-
-        self.client = app.test_client()
+class TestGetTestcasesHandler(_TestcaseHandlerTestCase):
 
     async def _get(self, project_id=1):
-        async with self.client as c:
-            return await c.get(f"/{project_id}/testcases")
+        return await self.client.get(f"/{project_id}/testcases")
 
     async def test_not_found_returns_404(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=404, body={"error": "Project id is invalid"})
         response = await self._get(999)
         self.assertEqual(response.status_code, 404)
@@ -106,15 +126,16 @@ class TestGetTestcasesHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(data["error"], "Project id is invalid")
 
     async def test_other_error_returns_500(self):
-        self.mock_rest_client.get.return_value = ApiResponse(status_code=503)
+        self.rest_client.get.return_value = ApiResponse(status_code=503)
         response = await self._get()
         self.assertEqual(response.status_code, 500)
 
     async def test_success_returns_200(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
-            status_code=200, body={"folders": [], "test_cases": []})
+        self.rest_client.get.return_value = ApiResponse(
+            status_code=200, body=_CMS_TESTCASES)
         response = await self._get()
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(await response.get_json(), _CMS_TESTCASES)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,6 @@ Unit tests for gateway user management route handlers:
   PATCH /users/<uuid>      - ModifyUserHandler
   POST /users/<uuid>/password - ResetPasswordHandler
 """
-import json
 import unittest
 from unittest.mock import AsyncMock, MagicMock
 from quart import Quart
@@ -83,7 +82,7 @@ class TestListUsersHandler(unittest.IsolatedAsyncioTestCase):
         self.mock_rc.get.return_value = _ok({"users": [_USER]})
         resp = await self._get()
         self.assertEqual(resp.status_code, 200)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["users"], [_USER])
 
     async def test_identity_url_is_correct(self):
@@ -132,7 +131,7 @@ class TestGetUserHandler(unittest.IsolatedAsyncioTestCase):
         self.mock_rc.get.return_value = _ok(_USER)
         resp = await self._get(_UUID)
         self.assertEqual(resp.status_code, 200)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body, _USER)
 
     async def test_uuid_included_in_url(self):
@@ -159,7 +158,7 @@ class TestGetUserHandler(unittest.IsolatedAsyncioTestCase):
     async def test_id_in_response_is_uuid_string(self):
         self.mock_rc.get.return_value = _ok(_USER)
         resp = await self._get()
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIsInstance(body["id"], str)
 
 
@@ -190,7 +189,7 @@ class TestCreateUserHandler(unittest.IsolatedAsyncioTestCase):
         resp = await self._post({"email_address": "a@b.com",
                                   "full_name": "A", "display_name": "A"})
         self.assertEqual(resp.status_code, 201)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["id"], _UUID)
 
     async def test_id_in_response_is_uuid_string(self):
@@ -198,7 +197,7 @@ class TestCreateUserHandler(unittest.IsolatedAsyncioTestCase):
             status_code=201, body={"id": _UUID})
         resp = await self._post({"email_address": "a@b.com",
                                   "full_name": "A", "display_name": "A"})
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIsInstance(body["id"], str)
 
     async def test_generated_password_propagated(self):
@@ -206,7 +205,7 @@ class TestCreateUserHandler(unittest.IsolatedAsyncioTestCase):
             status_code=201, body={"id": _UUID, "generated_password": "xyz"})
         resp = await self._post({"email_address": "a@b.com",
                                   "full_name": "A", "display_name": "A"})
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["generated_password"], "xyz")
 
     async def test_body_forwarded_to_identity(self):
@@ -1,8 +1,11 @@
 import unittest
-from test_service import TestService
+from test_service import TestService, TestServiceManageConfiguration
 from test_threadsafe_configuration import TestIdentityConfiguration
 from test_da_user_data_access_layer import TestUserRepository
-from test_da_invite_data_access_layer import TestInviteRepository
+from test_da_invite_data_access_layer import (
+    TestInviteRepository,
+    TestInviteRepositoryQueries,
+)
 from test_apis_authentication_api import TestAuthenticatePasswordHandler
 from test_apis_health_api import TestHealthHandler
 from test_services_authentication_service import TestAuthenticationService
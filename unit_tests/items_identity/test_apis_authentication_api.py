@@ -1,9 +1,8 @@
 import unittest
-import json
-import logging
 from http import HTTPStatus
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock, Mock
 from quart import Response
+from weaver_framework.microservice.api_response import ApiResponse
 from routes.auth.authenticate_password_handler import AuthenticatePasswordHandler
 
 
@@ -12,11 +11,15 @@ def _undecorated(method):
     return getattr(method, "__wrapped__", method)
 
 
+_AUTHENTICATE_PASSWORD = _undecorated(
+    AuthenticatePasswordHandler.authenticate_password)
+
+
 class TestAuthenticatePasswordHandler(unittest.IsolatedAsyncioTestCase):
 
     async def asyncSetUp(self):
-        self.mock_logger = MagicMock(spec=logging.Logger)
-        self.mock_child_logger = MagicMock(spec=logging.Logger)
+        self.mock_logger = Mock()
+        self.mock_child_logger = Mock()
         self.mock_logger.getChild.return_value = self.mock_child_logger
         self.mock_service_state = MagicMock()
         self.mock_config = MagicMock()
@@ -39,16 +42,16 @@ class TestAuthenticatePasswordHandler(unittest.IsolatedAsyncioTestCase):
             self.mock_logger, self.mock_service_state, self.mock_config)
 
     def _request(self, email="admin@localhost", password="secret"):
-        mock_request = MagicMock()
-        mock_request.body = {"email_address": email, "password": password}
-        return mock_request
+        return ApiResponse(
+            status_code=HTTPStatus.OK,
+            body={"email_address": email, "password": password})
 
     async def _call(self, success: bool, message: str,
                     email="admin@localhost", password="secret") -> Response:
         self.mock_auth_svc.authenticate_password = AsyncMock(
             return_value=(success, message))
-        target = _undecorated(self.handler.authenticate_password)
-        return await target(self.handler, self._request(email, password))
+        return await _AUTHENTICATE_PASSWORD(
+            self.handler, self._request(email, password))
 
     async def test_init_creates_repo_and_auth_service(self):
         self.mock_repo_cls.assert_called_once_with(
@@ -65,17 +68,17 @@ class TestAuthenticatePasswordHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_success_body_contains_success_true(self):
         resp: Response = await self._call(True, "ok")
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertTrue(body["success"])
 
     async def test_failure_body_contains_success_false(self):
         resp: Response = await self._call(False, "bad credentials")
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertFalse(body["success"])
 
     async def test_message_passed_through_to_response(self):
         resp: Response = await self._call(False, "Username/password don't match")
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["message"], "Username/password don't match")
 
     async def test_credentials_forwarded_to_service(self):
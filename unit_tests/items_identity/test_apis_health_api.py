@@ -1,7 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
-import json
-import logging
+from unittest.mock import MagicMock, Mock
 import time
 from quart import Response
 from http import HTTPStatus
@@ -13,7 +11,7 @@ from items.shared.service_health_enums import (ComponentDegradationLevel,
 
 class TestHealthHandler(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
-        self.mock_logger = MagicMock(spec=logging.Logger)
+        self.mock_logger = Mock()
         self.mock_state = MagicMock(spec=ServiceState)
         self.mock_state.startup_time = int(time.time()) - 5000
         self.mock_state.version = "1.2.3"
@@ -30,7 +28,7 @@ class TestHealthHandler(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(response, Response)
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        data = json.loads(await response.get_data(as_text=True))
+        data = await response.get_json()
         self.assertEqual(data["status"], ServiceDegradationStatus.HEALTHY.value)
         self.assertIsNone(data["issues"])
         self.assertAlmostEqual(data["uptime_seconds"], 5000, delta=2)
@@ -48,7 +46,7 @@ class TestHealthHandler(unittest.IsolatedAsyncioTestCase):
         response = await self.view.health()
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        data = json.loads(await response.get_data(as_text=True))
+        data = await response.get_json()
         self.assertEqual(data["status"], ServiceDegradationStatus.DEGRADED.value)
         self.assertEqual(len(data["issues"]), 1)
         self.assertEqual(data["issues"][0]["component"], "database")
@@ -64,7 +62,7 @@ class TestHealthHandler(unittest.IsolatedAsyncioTestCase):
         response = await self.view.health()
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        data = json.loads(await response.get_data(as_text=True))
+        data = await response.get_json()
         self.assertEqual(data["status"], ServiceDegradationStatus.CRITICAL.value)
         self.assertEqual(len(data["issues"]), 1)
         self.assertEqual(data["issues"][0]["component"], "database")
@@ -81,7 +79,7 @@ class TestHealthHandler(unittest.IsolatedAsyncioTestCase):
         response = await self.view.health()
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
-        data = json.loads(await response.get_data(as_text=True))
+        data = await response.get_json()
         self.assertEqual(data["status"], ServiceDegradationStatus.CRITICAL.value)
         self.assertEqual(len(data["issues"]), 2)
         self.assertEqual(data["issues"][0]["component"], "database")
@@ -5,10 +5,8 @@ Handler-level tests for the invite management API endpoints:
   POST /invites/uninvite - UninviteHandler
 """
 import unittest
-import json
-import logging
 from http import HTTPStatus
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock, Mock
 from routes.invites.create_invite_handler import CreateInviteHandler
 from routes.invites.resend_invite_handler import ResendInviteHandler
 from routes.invites.uninvite_handler import UninviteHandler
@@ -30,6 +28,11 @@ def _undecorated(method):
     return getattr(method, "__wrapped__", method)
 
 
+_CREATE_INVITE = _undecorated(CreateInviteHandler.create_invite)
+_RESEND_INVITE = _undecorated(ResendInviteHandler.resend_invite)
+_UNINVITE = _undecorated(UninviteHandler.uninvite)
+
+
 def _make_app():
     from quart import Quart
     app = Quart(__name__)
@@ -37,6 +40,10 @@ def _make_app():
     return app
 
 
+# Handlers only need an application context, so one app serves every test.
+_APP = _make_app()
+
+
 def _make_request(body: dict):
     from weaver_framework.microservice.api_response import ApiResponse
     return ApiResponse(status_code=HTTPStatus.OK, body=body)
@@ -45,8 +52,8 @@ def _make_request(body: dict):
 def _make_handler_setup(handler_cls, module_name: str):
     """Return asyncSetUp that wires handler with mocked InviteManagementService."""
     async def asyncSetUp(self):
-        self.mock_logger = MagicMock(spec=logging.Logger)
-        self.mock_logger.getChild.return_value = MagicMock(spec=logging.Logger)
+        self.mock_logger = Mock()
+        self.mock_logger.getChild.return_value = Mock()
         self.mock_config = MagicMock()
 
         invite_repo_patch = patch(
@@ -81,9 +88,8 @@ class TestCreateInviteHandler(unittest.IsolatedAsyncioTestCase):
     asyncSetUp = _make_handler_setup(CreateInviteHandler, "create_invite_handler")
 
     async def _call(self, email: str = _EMAIL):
-        app = _make_app()
-        async with app.app_context():
-            return await _undecorated(self.handler.create_invite)(
+        async with _APP.app_context():
+            return await _CREATE_INVITE(
                 self.handler, _make_request({"email_address": email}))
 
     async def test_success_returns_201(self):
@@ -98,7 +104,7 @@ class TestCreateInviteHandler(unittest.IsolatedAsyncioTestCase):
             return_value=InviteCreateResult(
                 status=InviteCreateStatus.SUCCESS, token=_TOKEN))
         response = await self._call()
-        body = json.loads(await response.get_data())
+        body = await response.get_json()
         self.assertEqual(body["token"], _TOKEN)
 
     async def test_email_passed_to_service(self):
@@ -120,7 +126,7 @@ class TestCreateInviteHandler(unittest.IsolatedAsyncioTestCase):
             return_value=InviteCreateResult(
                 status=InviteCreateStatus.ALREADY_REGISTERED))
         response = await self._call()
-        body = json.loads(await response.get_data())
+        body = await response.get_json()
         self.assertIn("already registered", body["error"])
 
     async def test_already_invited_returns_409(self):
@@ -135,7 +141,7 @@ class TestCreateInviteHandler(unittest.IsolatedAsyncioTestCase):
             return_value=InviteCreateResult(
                 status=InviteCreateStatus.ALREADY_INVITED))
         response = await self._call()
-        body = json.loads(await response.get_data())
+        body = await response.get_json()
         self.assertIn("pending invite", body["error"])
 
 
@@ -148,9 +154,8 @@ class TestResendInviteHandler(unittest.IsolatedAsyncioTestCase):
     asyncSetUp = _make_handler_setup(ResendInviteHandler, "resend_invite_handler")
 
     async def _call(self, email: str = _EMAIL):
-        app = _make_app()
-        async with app.app_context():
-            return await _undecorated(self.handler.resend_invite)(
+        async with _APP.app_context():
+            return await _RESEND_INVITE(
                 self.handler, _make_request({"email_address": email}))
 
     async def test_success_returns_200(self):
@@ -165,7 +170,7 @@ class TestResendInviteHandler(unittest.IsolatedAsyncioTestCase):
             return_value=InviteResendResult(
                 status=InviteResendStatus.SUCCESS, token=_TOKEN2))
         response = await self._call()
-        body = json.loads(await response.get_data())
+        body = await response.get_json()
         self.assertEqual(body["token"], _TOKEN2)
 
     async def test_email_passed_to_service(self):
@@ -187,7 +192,7 @@ class TestResendInviteHandler(unittest.IsolatedAsyncioTestCase):
             return_value=InviteResendResult(
                 status=InviteResendStatus.NO_PENDING_INVITE))
         response = await self._call()
-        body = json.loads(await response.get_data())
+        body = await response.get_json()
         self.assertIn("No pending invite", body["error"])
 
 
@@ -200,9 +205,8 @@ class TestUninviteHandler(unittest.IsolatedAsyncioTestCase):
     asyncSetUp = _make_handler_setup(UninviteHandler, "uninvite_handler")
 
     async def _call(self, email: str = _EMAIL):
-        app = _make_app()
-        async with app.app_context():
-            return await _undecorated(self.handler.uninvite)(
+        async with _APP.app_context():
+            return await _UNINVITE(
                 self.handler, _make_request({"email_address": email}))
 
     async def test_success_returns_200(self):
@@ -231,7 +235,7 @@ class TestUninviteHandler(unittest.IsolatedAsyncioTestCase):
             return_value=InviteUninviteResult(
                 status=InviteUninviteStatus.NO_PENDING_INVITE))
         response = await self._call()
-        body = json.loads(await response.get_data())
+        body = await response.get_json()
         self.assertIn("No pending invite", body["error"])
 
 
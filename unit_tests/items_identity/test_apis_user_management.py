@@ -8,11 +8,10 @@ Handler-level tests for the user management API endpoints:
   POST /users/me/password   - ChangePasswordHandler
 """
 import unittest
-import json
-import logging
 from http import HTTPStatus
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock, Mock
 from quart import Response
+from weaver_framework.microservice.api_response import ApiResponse
 from routes.users.list_users_handler import ListUsersHandler
 from routes.users.get_user_handler import GetUserHandler
 from routes.users.create_user_handler import CreateUserHandler
@@ -46,11 +45,19 @@ def _undecorated(method):
     return getattr(method, "__wrapped__", method)
 
 
+# The handler methods with their request-validation decorator peeled off,
+# resolved once so tests can pass a pre-built request message directly.
+_CREATE_USER = _undecorated(CreateUserHandler.create_user)
+_MODIFY_USER = _undecorated(ModifyUserHandler.modify_user)
+_RESET_PASSWORD = _undecorated(ResetPasswordHandler.reset_password)
+_CHANGE_PASSWORD = _undecorated(ChangePasswordHandler.change_password)
+
+
 def _make_handler_setup(handler_cls):
     """Return an asyncSetUp that wires up a handler with mocked service."""
     async def asyncSetUp(self):
-        self.mock_logger = MagicMock(spec=logging.Logger)
-        self.mock_logger.getChild.return_value = MagicMock(spec=logging.Logger)
+        self.mock_logger = Mock()
+        self.mock_logger.getChild.return_value = Mock()
         self.mock_state = MagicMock()
         self.mock_config = MagicMock()
 
@@ -89,19 +96,19 @@ class TestListUsersHandler(unittest.IsolatedAsyncioTestCase):
     async def test_success_returns_200_with_users(self):
         resp = await self._call(UserListResult(users=[_USER_DICT]))
         self.assertEqual(resp.status_code, HTTPStatus.OK)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["users"], [_USER_DICT])
 
     async def test_empty_list_returns_200(self):
         resp = await self._call(UserListResult(users=[]))
         self.assertEqual(resp.status_code, HTTPStatus.OK)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["users"], [])
 
     async def test_unavailable_returns_503(self):
         resp = await self._call(UserListResult(available=False))
         self.assertEqual(resp.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_response_is_json(self):
@@ -125,13 +132,13 @@ class TestGetUserHandler(unittest.IsolatedAsyncioTestCase):
     async def test_success_returns_200_with_user(self):
         resp = await self._call(UserLookupResult(user=_USER_DICT))
         self.assertEqual(resp.status_code, HTTPStatus.OK)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body, _USER_DICT)
 
     async def test_not_found_returns_404(self):
         resp = await self._call(UserLookupResult(found=False))
         self.assertEqual(resp.status_code, HTTPStatus.NOT_FOUND)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_unavailable_returns_503(self):
@@ -154,7 +161,7 @@ class TestGetUserHandler(unittest.IsolatedAsyncioTestCase):
 
     async def test_id_in_response_is_uuid_string(self):
         resp = await self._call(UserLookupResult(user=_USER_DICT))
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIsInstance(body["id"], str)
         self.assertEqual(body["id"], _UUID)
 
@@ -174,30 +181,28 @@ class TestCreateUserHandler(unittest.IsolatedAsyncioTestCase):
             "display_name": "New",
         }
         body.update(overrides)
-        mock_req = MagicMock()
-        mock_req.body = body
-        return mock_req
+        return ApiResponse(status_code=HTTPStatus.OK, body=body)
 
     async def _call(self, result: UserCreateResult, **body_overrides) -> Response:
         self.mock_svc.create_user = AsyncMock(return_value=result)
-        target = _undecorated(self.handler.create_user)
-        return await target(self.handler, self._request(**body_overrides))
+        return await _CREATE_USER(self.handler,
+                                  self._request(**body_overrides))
 
     async def test_success_returns_201_with_uuid(self):
         resp = await self._call(UserCreateResult(user_uuid=_UUID))
         self.assertEqual(resp.status_code, HTTPStatus.CREATED)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["id"], _UUID)
 
     async def test_id_in_response_is_uuid_string(self):
         resp = await self._call(UserCreateResult(user_uuid=_UUID))
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIsInstance(body["id"], str)
 
     async def test_conflict_returns_409(self):
         resp = await self._call(UserCreateResult(conflict=True))
         self.assertEqual(resp.status_code, HTTPStatus.CONFLICT)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_unavailable_returns_503(self):
@@ -229,12 +234,12 @@ class TestCreateUserHandler(unittest.IsolatedAsyncioTestCase):
     async def test_generated_password_included_in_201_when_set(self):
         resp = await self._call(
             UserCreateResult(user_uuid=_UUID, generated_password="abc123!@#XYZ"))
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body["generated_password"], "abc123!@#XYZ")
 
     async def test_generated_password_absent_from_201_when_not_set(self):
         resp = await self._call(UserCreateResult(user_uuid=_UUID))
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertNotIn("generated_password", body)
 
     async def test_response_is_json(self):
@@ -252,16 +257,14 @@ class TestModifyUserHandler(unittest.IsolatedAsyncioTestCase):
 
     def _request(self, **overrides):
         # All fields optional (patch-style); default body is empty.
-        mock_req = MagicMock()
-        mock_req.body = overrides
-        return mock_req
+        return ApiResponse(status_code=HTTPStatus.OK, body=overrides)
 
     async def _call(self, result: UserUpdateResult,
                     user_id: str = _UUID, **body_overrides) -> Response:
         self.mock_svc.update_user = AsyncMock(return_value=result)
-        target = _undecorated(self.handler.modify_user)
-        return await target(self.handler, self._request(**body_overrides),
-                            user_id=user_id)
+        return await _MODIFY_USER(self.handler,
+                                  self._request(**body_overrides),
+                                  user_id=user_id)
 
     async def test_success_returns_200(self):
         resp = await self._call(UserUpdateResult(success=True))
@@ -270,18 +273,18 @@ class TestModifyUserHandler(unittest.IsolatedAsyncioTestCase):
     async def test_not_found_returns_404(self):
         resp = await self._call(UserUpdateResult(found=False))
         self.assertEqual(resp.status_code, HTTPStatus.NOT_FOUND)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_forbidden_returns_403(self):
         resp = await self._call(UserUpdateResult(forbidden=True))
         self.assertEqual(resp.status_code, HTTPStatus.FORBIDDEN)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_forbidden_error_mentions_last_administrator(self):
         resp = await self._call(UserUpdateResult(forbidden=True))
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("last", body["error"].lower())
 
     async def test_unavailable_returns_503(self):
@@ -291,8 +294,7 @@ class TestModifyUserHandler(unittest.IsolatedAsyncioTestCase):
     async def test_uuid_from_url_passed_to_service(self):
         self.mock_svc.update_user = AsyncMock(
             return_value=UserUpdateResult(success=True))
-        target = _undecorated(self.handler.modify_user)
-        await target(self.handler, self._request(), user_id=_UUID2)
+        await _MODIFY_USER(self.handler, self._request(), user_id=_UUID2)
         self.assertEqual(
             self.mock_svc.update_user.call_args[1]["user_uuid"], _UUID2)
 
@@ -300,9 +302,8 @@ class TestModifyUserHandler(unittest.IsolatedAsyncioTestCase):
         """Fields present in body are forwarded; absent fields are None."""
         self.mock_svc.update_user = AsyncMock(
             return_value=UserUpdateResult(success=True))
-        target = _undecorated(self.handler.modify_user)
-        await target(self.handler,
-                     self._request(full_name="Changed"), user_id=_UUID)
+        await _MODIFY_USER(self.handler,
+                           self._request(full_name="Changed"), user_id=_UUID)
         kwargs = self.mock_svc.update_user.call_args[1]
         self.assertEqual(kwargs["full_name"], "Changed")
         self.assertIsNone(kwargs["display_name"])
@@ -323,15 +324,14 @@ class TestResetPasswordHandler(unittest.IsolatedAsyncioTestCase):
     asyncSetUp = _make_handler_setup(ResetPasswordHandler)
 
     def _request(self, new_password="newpass123"):
-        mock_req = MagicMock()
-        mock_req.body = {"new_password": new_password}
-        return mock_req
+        return ApiResponse(status_code=HTTPStatus.OK,
+                           body={"new_password": new_password})
 
     async def _call(self, result: PasswordResult,
                     user_id: str = _UUID) -> Response:
         self.mock_svc.reset_password = AsyncMock(return_value=result)
-        target = _undecorated(self.handler.reset_password)
-        return await target(self.handler, self._request(), user_id=user_id)
+        return await _RESET_PASSWORD(self.handler, self._request(),
+                                     user_id=user_id)
 
     async def test_success_returns_200(self):
         resp = await self._call(PasswordResult(success=True))
@@ -340,7 +340,7 @@ class TestResetPasswordHandler(unittest.IsolatedAsyncioTestCase):
     async def test_not_found_returns_404(self):
         resp = await self._call(PasswordResult(found=False))
         self.assertEqual(resp.status_code, HTTPStatus.NOT_FOUND)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_unavailable_returns_503(self):
@@ -350,8 +350,7 @@ class TestResetPasswordHandler(unittest.IsolatedAsyncioTestCase):
     async def test_uuid_passed_to_service(self):
         self.mock_svc.reset_password = AsyncMock(
             return_value=PasswordResult(success=True))
-        target = _undecorated(self.handler.reset_password)
-        await target(self.handler, self._request(), user_id=_UUID2)
+        await _RESET_PASSWORD(self.handler, self._request(), user_id=_UUID2)
         self.assertEqual(
             self.mock_svc.reset_password.call_args[1]["user_uuid"], _UUID2)
 
@@ -370,20 +369,17 @@ class TestChangePasswordHandler(unittest.IsolatedAsyncioTestCase):
 
     def _request(self, user_id=_UUID, current_password="oldpass",
                  new_password="newpass123"):
-        mock_req = MagicMock()
-        mock_req.body = {
+        return ApiResponse(status_code=HTTPStatus.OK, body={
             "user_id": user_id,
             "current_password": current_password,
             "new_password": new_password,
-        }
-        return mock_req
+        })
 
     async def _call(self, result: PasswordResult,
                     user_id=_UUID, current_password="old",
                     new_password="new123") -> Response:
         self.mock_svc.change_own_password = AsyncMock(return_value=result)
-        target = _undecorated(self.handler.change_password)
-        return await target(
+        return await _CHANGE_PASSWORD(
             self.handler,
             self._request(user_id, current_password, new_password))
 
@@ -394,7 +390,7 @@ class TestChangePasswordHandler(unittest.IsolatedAsyncioTestCase):
     async def test_wrong_password_returns_401(self):
         resp = await self._call(PasswordResult(wrong_password=True))
         self.assertEqual(resp.status_code, HTTPStatus.UNAUTHORIZED)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_not_found_returns_404(self):
@@ -412,8 +408,7 @@ class TestChangePasswordHandler(unittest.IsolatedAsyncioTestCase):
     async def test_credentials_passed_to_service(self):
         self.mock_svc.change_own_password = AsyncMock(
             return_value=PasswordResult(success=True))
-        target = _undecorated(self.handler.change_password)
-        await target(
+        await _CHANGE_PASSWORD(
             self.handler,
             self._request(user_id=_UUID2, current_password="old",
                           new_password="new"))
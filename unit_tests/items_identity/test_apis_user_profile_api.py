@@ -1,9 +1,8 @@
 import unittest
-import json
-import logging
 from http import HTTPStatus
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock, Mock
 from quart import Response
+from weaver_framework.microservice.api_response import ApiResponse
 from routes.users.get_user_profile_handler import GetUserProfileHandler
 from services.user_profile_service import UserProfileResult
 
@@ -23,11 +22,14 @@ def _undecorated(method):
     return getattr(method, "__wrapped__", method)
 
 
+_GET_USER_PROFILE = _undecorated(GetUserProfileHandler.get_user_profile)
+
+
 class TestGetUserProfileHandler(unittest.IsolatedAsyncioTestCase):
 
     async def asyncSetUp(self):
-        self.mock_logger = MagicMock(spec=logging.Logger)
-        self.mock_child_logger = MagicMock(spec=logging.Logger)
+        self.mock_logger = Mock()
+        self.mock_child_logger = Mock()
         self.mock_logger.getChild.return_value = self.mock_child_logger
         self.mock_service_state = MagicMock()
         self.mock_config = MagicMock()
@@ -50,15 +52,13 @@ class TestGetUserProfileHandler(unittest.IsolatedAsyncioTestCase):
             self.mock_logger, self.mock_service_state, self.mock_config)
 
     def _request(self, email="admin@localhost"):
-        mock_request = MagicMock()
-        mock_request.body = {"email_address": email}
-        return mock_request
+        return ApiResponse(status_code=HTTPStatus.OK,
+                           body={"email_address": email})
 
     async def _call(self, result: UserProfileResult, email="admin@localhost"):
         self.mock_profile_svc_instance.get_profile_by_email = AsyncMock(
             return_value=result)
-        target = _undecorated(self.handler.get_user_profile)
-        return await target(self.handler, self._request(email))
+        return await _GET_USER_PROFILE(self.handler, self._request(email))
 
     async def test_init_creates_profile_service_and_user_repo(self):
         self.mock_user_repo_cls.assert_called_once_with(
@@ -70,7 +70,7 @@ class TestGetUserProfileHandler(unittest.IsolatedAsyncioTestCase):
             UserProfileResult(profile=ADMIN_PROFILE))
 
         self.assertEqual(resp.status_code, HTTPStatus.OK)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertEqual(body, ADMIN_PROFILE)
         self.assertTrue(body["is_administrator"])
 
@@ -78,14 +78,14 @@ class TestGetUserProfileHandler(unittest.IsolatedAsyncioTestCase):
         resp: Response = await self._call(UserProfileResult(found=False))
 
         self.assertEqual(resp.status_code, HTTPStatus.NOT_FOUND)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_unavailable_returns_503(self):
         resp: Response = await self._call(UserProfileResult(available=False))
 
         self.assertEqual(resp.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
-        body = json.loads(await resp.get_data())
+        body = await resp.get_json()
         self.assertIn("error", body)
 
     async def test_unavailable_takes_precedence_over_not_found(self):
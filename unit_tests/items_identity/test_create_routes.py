@@ -427,8 +427,8 @@ class TestCreateInviteRoutes(unittest.IsolatedAsyncioTestCase):
         mock_handler.uninvite.assert_called_once()
 
 
-class TestCreateRoutes(unittest.IsolatedAsyncioTestCase):
-    async def asyncSetUp(self):
+class TestCreateRoutes(unittest.TestCase):
+    def setUp(self):
         self.mock_logger = MagicMock(spec=logging.Logger)
         self.mock_state = MagicMock()
         self.mock_config = MagicMock()
@@ -437,9 +437,9 @@ class TestCreateRoutes(unittest.IsolatedAsyncioTestCase):
     @patch("routes.create_system_routes")
     @patch("routes.create_invite_routes")
     @patch("routes.create_auth_routes")
-    async def test_returns_blueprint_with_correct_name(self, mock_auth,
-                                                       mock_invite, mock_sys,
-                                                       mock_users):
+    def test_returns_blueprint_with_correct_name(self, mock_auth,
+                                                 mock_invite, mock_sys,
+                                                 mock_users):
         mock_auth.return_value = quart.Blueprint("mock_auth", __name__)
         mock_invite.return_value = quart.Blueprint("mock_invite", __name__)
         mock_sys.return_value = quart.Blueprint("mock_sys", __name__)
@@ -452,8 +452,8 @@ class TestCreateRoutes(unittest.IsolatedAsyncioTestCase):
     @patch("routes.create_system_routes")
     @patch("routes.create_invite_routes")
     @patch("routes.create_auth_routes")
-    async def test_registers_all_sub_blueprints(self, mock_auth, mock_invite,
-                                                mock_sys, mock_users):
+    def test_registers_all_sub_blueprints(self, mock_auth, mock_invite,
+                                          mock_sys, mock_users):
         mock_auth.return_value = quart.Blueprint("mock_auth", __name__)
         mock_invite.return_value = quart.Blueprint("mock_invite", __name__)
         mock_sys.return_value = quart.Blueprint("mock_sys", __name__)
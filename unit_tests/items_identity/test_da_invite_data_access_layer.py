@@ -69,11 +69,6 @@ class TestInviteRepository(unittest.IsolatedAsyncioTestCase):
             (_TOKEN,),
             fetch_one=True)
 
-    async def test_get_invite_by_token_query_includes_all_columns(self):
-        for col in ("token", "email_address", "created_at", "expires_at",
-                    "is_expired", "expired_at"):
-            self.assertIn(col, InviteRepository.GET_INVITE_BY_TOKEN_QUERY)
-
     # -------------------------------------------------------
     # get_invite_by_email
     # -------------------------------------------------------
@@ -96,10 +91,6 @@ class TestInviteRepository(unittest.IsolatedAsyncioTestCase):
             (_EMAIL,),
             fetch_one=True)
 
-    async def test_get_invite_by_email_query_filters_pending_only(self):
-        self.assertIn("is_expired = 0",
-                      InviteRepository.GET_INVITE_BY_EMAIL_QUERY)
-
     # -------------------------------------------------------
     # create_invite
     # -------------------------------------------------------
@@ -116,10 +107,6 @@ class TestInviteRepository(unittest.IsolatedAsyncioTestCase):
             InviteRepository.INSERT_INVITE_QUERY,
             (_TOKEN, _EMAIL, _NOW, _EXPIRES))
 
-    async def test_insert_query_includes_token_and_email(self):
-        for col in ("token", "email_address", "created_at", "expires_at"):
-            self.assertIn(col, InviteRepository.INSERT_INVITE_QUERY)
-
     # -------------------------------------------------------
     # resend_invite
     # -------------------------------------------------------
@@ -131,13 +118,6 @@ class TestInviteRepository(unittest.IsolatedAsyncioTestCase):
             (_TOKEN2, _EXPIRES, _EMAIL),
             commit=True)
 
-    async def test_resend_invite_query_updates_token_and_expires(self):
-        self.assertIn("token", InviteRepository.RESEND_INVITE_QUERY)
-        self.assertIn("expires_at", InviteRepository.RESEND_INVITE_QUERY)
-
-    async def test_resend_invite_query_filters_pending_only(self):
-        self.assertIn("is_expired = 0", InviteRepository.RESEND_INVITE_QUERY)
-
     # -------------------------------------------------------
     # uninvite
     # -------------------------------------------------------
@@ -149,18 +129,6 @@ class TestInviteRepository(unittest.IsolatedAsyncioTestCase):
             (_NOW, _EMAIL),
             commit=True)
 
-    async def test_uninvite_query_sets_is_expired(self):
-        self.assertIn("is_expired = 1",
-                      InviteRepository.SOFT_EXPIRE_BY_EMAIL_QUERY)
-
-    async def test_uninvite_query_sets_expired_at(self):
-        self.assertIn("expired_at",
-                      InviteRepository.SOFT_EXPIRE_BY_EMAIL_QUERY)
-
-    async def test_uninvite_query_filters_pending_only(self):
-        self.assertIn("is_expired = 0",
-                      InviteRepository.SOFT_EXPIRE_BY_EMAIL_QUERY)
-
     # -------------------------------------------------------
     # expire_pending_invites
     # -------------------------------------------------------
@@ -172,15 +140,52 @@ class TestInviteRepository(unittest.IsolatedAsyncioTestCase):
             (_NOW, _NOW),
             commit=True)
 
-    async def test_expire_pending_query_sets_is_expired(self):
+
+class TestInviteRepositoryQueries(unittest.TestCase):
+    """Checks on the SQL text of the repository queries. These only read
+    class attributes, so they need neither a repository nor an event loop."""
+
+    def test_get_invite_by_token_query_includes_all_columns(self):
+        for col in ("token", "email_address", "created_at", "expires_at",
+                    "is_expired", "expired_at"):
+            self.assertIn(col, InviteRepository.GET_INVITE_BY_TOKEN_QUERY)
+
+    def test_get_invite_by_email_query_filters_pending_only(self):
+        self.assertIn("is_expired = 0",
+                      InviteRepository.GET_INVITE_BY_EMAIL_QUERY)
+
+    def test_insert_query_includes_token_and_email(self):
+        for col in ("token", "email_address", "created_at", "expires_at"):
+            self.assertIn(col, InviteRepository.INSERT_INVITE_QUERY)
+
+    def test_resend_invite_query_updates_token_and_expires(self):
+        self.assertIn("token", InviteRepository.RESEND_INVITE_QUERY)
+        self.assertIn("expires_at", InviteRepository.RESEND_INVITE_QUERY)
+
+    def test_resend_invite_query_filters_pending_only(self):
+        self.assertIn("is_expired = 0", InviteRepository.RESEND_INVITE_QUERY)
+
+    def test_uninvite_query_sets_is_expired(self):
+        self.assertIn("is_expired = 1",
+                      InviteRepository.SOFT_EXPIRE_BY_EMAIL_QUERY)
+
+    def test_uninvite_query_sets_expired_at(self):
+        self.assertIn("expired_at",
+                      InviteRepository.SOFT_EXPIRE_BY_EMAIL_QUERY)
+
+    def test_uninvite_query_filters_pending_only(self):
+        self.assertIn("is_expired = 0",
+                      InviteRepository.SOFT_EXPIRE_BY_EMAIL_QUERY)
+
+    def test_expire_pending_query_sets_is_expired(self):
         self.assertIn("is_expired = 1",
                       InviteRepository.SOFT_EXPIRE_PENDING_QUERY)
 
-    async def test_expire_pending_query_filters_pending_only(self):
+    def test_expire_pending_query_filters_pending_only(self):
         self.assertIn("is_expired = 0",
                       InviteRepository.SOFT_EXPIRE_PENDING_QUERY)
 
-    async def test_expire_pending_query_checks_expires_at(self):
+    def test_expire_pending_query_checks_expires_at(self):
         self.assertIn("expires_at", InviteRepository.SOFT_EXPIRE_PENDING_QUERY)
 
 
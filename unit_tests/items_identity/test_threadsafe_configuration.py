@@ -1,43 +1,49 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock
 from items.services.items_identity.configuration_layout import ConfigurationConstants as consts
 from items.services.items_identity.identity_configuration import IdentityConfiguration
 
 
 class TestIdentityConfiguration(unittest.TestCase):
 
-    @patch.object(IdentityConfiguration, 'get_entry')
-    def test_logging_log_level(self, mock_get_entry):
-        mock_get_entry.return_value = "DEBUG"
-        config = IdentityConfiguration()
-        log_level = config.logging_log_level
-        mock_get_entry.assert_called_once_with(
+    def setUp(self):
+        self.config = IdentityConfiguration()
+        self.config.get_entry = Mock()
+
+    def test_logging_log_level(self):
+        self.config.get_entry.return_value = "DEBUG"
+        log_level = self.config.logging_log_level
+        self.config.get_entry.assert_called_once_with(
             consts.SECTION_LOGGING, consts.ITEM_LOGGING_LOG_LEVEL)
         self.assertEqual(log_level, "DEBUG")
 
-    @patch.object(IdentityConfiguration, 'get_entry')
-    def test_backend_db_filename(self, mock_get_entry):
-        mock_get_entry.return_value = "/path/to/database.db"
-        config = IdentityConfiguration()
-        db_filename = config.backend_db_filename
-        mock_get_entry.assert_called_once_with(
+    def test_backend_db_filename(self):
+        self.config.get_entry.return_value = "/path/to/database.db"
+        db_filename = self.config.backend_db_filename
+        self.config.get_entry.assert_called_once_with(
             consts.SECTION_BACKEND, consts.ITEM_BACKEND_DB_FILENAME)
         self.assertEqual(db_filename, "/path/to/database.db")
 
-    @patch.object(IdentityConfiguration, 'get_entry')
-    def test_logging_log_level_default(self, mock_get_entry):
-        mock_get_entry.return_value = "INFO"
-        config = IdentityConfiguration()
-        log_level = config.logging_log_level
-        mock_get_entry.assert_called_once_with(
+    def test_logging_log_level_default(self):
+        self.config.get_entry.return_value = "INFO"
+        log_level = self.config.logging_log_level
+        self.config.get_entry.assert_called_once_with(
             consts.SECTION_LOGGING, consts.ITEM_LOGGING_LOG_LEVEL)
         self.assertEqual(log_level, "INFO")
 
-    @patch.object(IdentityConfiguration, 'get_entry')
-    def test_backend_db_filename_default(self, mock_get_entry):
-        mock_get_entry.return_value = "/default/path/to/database.db"
-        config = IdentityConfiguration()
-        db_filename = config.backend_db_filename
-        mock_get_entry.assert_called_once_with(
+    def test_backend_db_filename_default(self):
+        self.config.get_entry.return_value = "/default/path/to/database.db"
+        db_filename = self.config.backend_db_filename
+        self.config.get_entry.assert_called_once_with(
             consts.SECTION_BACKEND, consts.ITEM_BACKEND_DB_FILENAME)
         self.assertEqual(db_filename, "/default/path/to/database.db")
+
+    def test_properties_are_not_cached(self):
+        # Properties must read through to get_entry on every access so that
+        # tests patching get_entry with different values cannot leak into
+        # one another through a cached result.
+        self.config.get_entry.return_value = "DEBUG"
+        self.assertEqual(self.config.logging_log_level, "DEBUG")
+        self.config.get_entry.return_value = "INFO"
+        self.assertEqual(self.config.logging_log_level, "INFO")
+        self.assertEqual(self.config.get_entry.call_count, 2)
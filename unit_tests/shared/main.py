@@ -1,6 +1,14 @@
+import os
 import unittest
-from test_api_signature import TestApiSignature
-from test_service_state import TestServicerState
+
+
+def load_tests(loader, standard_tests, pattern):
+    """Collect every test_*.py module alongside this file."""
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    standard_tests.addTests(loader.discover(start_dir=this_dir,
+                                            pattern=pattern or "test_*.py"))
+    return standard_tests
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 import unittest
 from items.shared.api_signature import verify_api_signature, generate_api_signature
 
@@ -25,12 +27,34 @@ class TestApiSignature(unittest.TestCase):
         self.assertIsInstance(sig, str)
         self.assertTrue(len(sig) > 0)
 
+    def test_generate_dict_signs_compact_sorted_json(self):
+        # Pins the wire format the gateway and web portal agree on.
+        expected = hmac.new(self.SECRET_KEY, b'{"a":1,"b":"\\u00e9"}',
+                            hashlib.sha256).hexdigest()
+        self.assertEqual(
+            generate_api_signature(self.SECRET_KEY, {"b": "\u00e9", "a": 1}),
+            expected)
+
     def test_generate_dict_is_deterministic(self):
         data = {"b": 2, "a": 1}
         sig1 = generate_api_signature(self.SECRET_KEY, data)
         sig2 = generate_api_signature(self.SECRET_KEY, data)
         self.assertEqual(sig1, sig2)
 
+    def test_generate_matches_hmac_sha256(self):
+        expected = hmac.new(self.SECRET_KEY, b"hello", hashlib.sha256)
+        self.assertEqual(generate_api_signature(self.SECRET_KEY, b"hello"),
+                         expected.hexdigest())
+
+    def test_generate_differs_per_secret_key(self):
+        self.assertNotEqual(generate_api_signature(b"key-one", b"hello"),
+                            generate_api_signature(b"key-two", b"hello"))
+
+    def test_generate_accepts_bytearray_key(self):
+        self.assertEqual(
+            generate_api_signature(bytearray(self.SECRET_KEY), b"hello"),
+            generate_api_signature(self.SECRET_KEY, b"hello"))
+
     def test_generate_invalid_type_raises(self):
         with self.assertRaises(TypeError):
             generate_api_signature(self.SECRET_KEY, 12345)
@@ -56,11 +80,30 @@ class TestApiSignature(unittest.TestCase):
         sig = generate_api_signature(self.SECRET_KEY, b"hello")
         self.assertFalse(verify_api_signature(self.SECRET_KEY, b"world", sig))
 
+    def test_verify_non_hex_signature_returns_false(self):
+        for signature in ("invalidsignature", "abc", ""):
+            with self.subTest(signature=signature):
+                self.assertFalse(verify_api_signature(
+                    self.SECRET_KEY, b"hello", signature))
+
     def test_verify_invalid_type_raises(self):
         sig = generate_api_signature(self.SECRET_KEY, b"hello")
         with self.assertRaises(TypeError):
             verify_api_signature(self.SECRET_KEY, 99, sig)
 
+    def test_verify_invalid_type_with_non_hex_signature_raises(self):
+        with self.assertRaises(TypeError):
+            verify_api_signature(self.SECRET_KEY, 12345, "zz")
+
+    def test_verify_rejects_non_canonical_hex_signature(self):
+        sig = generate_api_signature(self.SECRET_KEY, b"hello")
+        spaced = " ".join(sig[i:i + 2] for i in range(0, len(sig), 2))
+        for name, signature in (("uppercase", sig.upper()),
+                                ("space_separated", spaced)):
+            with self.subTest(name):
+                self.assertFalse(verify_api_signature(
+                    self.SECRET_KEY, b"hello", signature))
+
     def test_generate_and_verify_roundtrip(self):
         data = {"user": "paul", "action": "login"}
         sig = generate_api_signature(self.SECRET_KEY, data)
@@ -14,12 +14,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 import os
+from types import SimpleNamespace
 from quart import Quart
 import items.services.items_web_portal as portal_pkg
 
 _TEMPLATE_FOLDER = os.path.join(os.path.dirname(portal_pkg.__file__),
                                 "templates")
 
+# Handlers only read the instance name from the metadata settings, so a plain
+# read-only namespace is shared by every test rather than a mock per test.
+METADATA = SimpleNamespace(instance_name="INSTANCE")
+
 
 def make_app(name: str = __name__) -> Quart:
     """Create a Quart app wired to the real portal templates directory.
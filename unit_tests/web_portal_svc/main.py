@@ -50,6 +50,7 @@ from test_admin_users_handlers import (
 from test_projects_testcases_handlers import (
     TestGetProjectOverviewPageHandler,
     TestGetProjectTestcasesPageHandler,
+    TestTransformTestsDetailsData,
 )
 
 if __name__ == "__main__":
@@ -18,7 +18,7 @@ import unittest
 from unittest.mock import AsyncMock, MagicMock
 from http import HTTPStatus
 from weaver_framework.microservice.api_response import ApiResponse
-from _test_utils import make_app
+from _test_utils import METADATA, make_app
 from items.services.items_web_portal.page_handlers.admin.\
     admin_customisations_page_handler import AdminCustomisationsPageHandler
 
@@ -35,12 +35,6 @@ def _config():
     return config
 
 
-def _metadata():
-    metadata = MagicMock()
-    metadata.instance_name = "INSTANCE"
-    return metadata
-
-
 def _row(field_id=1, field_name="Priority", description="desc",
         system_name="priority", field_type="Dropdown", entry_type="user",
         enabled=1, position=1, is_required=0, default_value="Medium",
@@ -64,7 +58,7 @@ class TestCustomisationsRead(unittest.IsolatedAsyncioTestCase):
         self.mock_rest_client = AsyncMock()
         self.mock_rest_client.post.return_value = _SESSION_VALID
         handler = AdminCustomisationsPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
@@ -125,7 +119,7 @@ class TestCaseFieldAdd(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         self.mock_rest_client = AsyncMock()
         handler = AdminCustomisationsPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
@@ -226,7 +220,7 @@ class TestCaseFieldModify(unittest.IsolatedAsyncioTestCase):
         self.mock_rest_client = AsyncMock()
         self.mock_rest_client.post.return_value = _SESSION_VALID
         handler = AdminCustomisationsPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
@@ -340,7 +334,7 @@ class TestCaseFieldDelete(unittest.IsolatedAsyncioTestCase):
         self.mock_rest_client = AsyncMock()
         self.mock_rest_client.post.return_value = _SESSION_VALID
         handler = AdminCustomisationsPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
@@ -386,7 +380,7 @@ class TestCaseFieldMove(unittest.IsolatedAsyncioTestCase):
         self.mock_rest_client = AsyncMock()
         self.mock_rest_client.post.return_value = _SESSION_VALID
         handler = AdminCustomisationsPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
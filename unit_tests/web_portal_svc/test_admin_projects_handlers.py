@@ -17,7 +17,7 @@ import unittest
 from unittest.mock import AsyncMock, MagicMock
 from http import HTTPStatus
 from weaver_framework.microservice.api_response import ApiResponse
-from _test_utils import make_app
+from _test_utils import METADATA, make_app
 from items.services.items_web_portal.page_handlers.admin.projects.\
     admin_projects_page_handlers import AdminProjectsPageHandlers
 from items.services.items_web_portal.page_handlers.admin.projects.\
@@ -40,12 +40,6 @@ def _config():
     return config
 
 
-def _metadata():
-    metadata = MagicMock()
-    metadata.instance_name = "INSTANCE"
-    return metadata
-
-
 # ------------------------------------------------------------------
 # AdminProjectsPageHandlers
 # ------------------------------------------------------------------
@@ -59,7 +53,7 @@ class TestAdminProjectsPageHandlers(unittest.IsolatedAsyncioTestCase):
         self.mock_rest_client = AsyncMock()
         self.mock_rest_client.post.return_value = _SESSION_VALID
         handler = AdminProjectsPageHandlers(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
@@ -124,7 +118,7 @@ class TestAdminAddProjectPageHandlers(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         self.mock_rest_client = AsyncMock()
         handler = AdminAddProjectPageHandlers(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
@@ -231,7 +225,7 @@ class TestAdminModifyProjectPageHandlers(unittest.IsolatedAsyncioTestCase):
         self.mock_rest_client = AsyncMock()
         self.mock_rest_client.post.return_value = _SESSION_VALID
         handler = AdminModifyProjectPageHandlers(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
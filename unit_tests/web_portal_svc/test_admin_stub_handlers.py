@@ -17,7 +17,7 @@ import unittest
 from unittest.mock import AsyncMock, MagicMock
 from http import HTTPStatus
 from weaver_framework.microservice.api_response import ApiResponse
-from _test_utils import make_app
+from _test_utils import METADATA, make_app
 from items.services.items_web_portal.page_handlers.admin.dashboard.\
     admin_overview_page_handler import AdminOverviewPageHandler
 from items.services.items_web_portal.page_handlers.admin.\
@@ -38,12 +38,6 @@ def _config():
     return config
 
 
-def _metadata():
-    metadata = MagicMock()
-    metadata.instance_name = "INSTANCE"
-    return metadata
-
-
 _AUTH_HEADERS = {"Cookie": "items_token=abc; items_user=bob"}
 
 
@@ -60,7 +54,7 @@ def _make_stub_test(handler_cls, method_name, route_path):
                 status_code=HTTPStatus.OK,
                 body={"status": "VALID", "is_administrator": True})
             handler = handler_cls(_LOGGER, _config(), self.rest_client,
-                                  _metadata())
+                                  METADATA)
 
             app = make_app()
 
@@ -121,7 +115,7 @@ class TestAdminUsersAndRolesPageHandler(unittest.IsolatedAsyncioTestCase):
             status_code=HTTPStatus.OK,
             body={"status": "VALID", "is_administrator": True})
         handler = AdminUsersAndRolesPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
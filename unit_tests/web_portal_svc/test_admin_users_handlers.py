@@ -17,7 +17,7 @@ import unittest
 from unittest.mock import AsyncMock, MagicMock
 from http import HTTPStatus
 from weaver_framework.microservice.api_response import ApiResponse
-from _test_utils import make_app
+from _test_utils import METADATA, make_app
 from items.services.items_web_portal.page_handlers.admin.users.\
     admin_add_user_page_handler import AdminAddUserPageHandler
 from items.services.items_web_portal.page_handlers.admin.users.\
@@ -63,12 +63,6 @@ def _config():
     return cfg
 
 
-def _metadata():
-    m = MagicMock()
-    m.instance_name = "INSTANCE"
-    return m
-
-
 # ---------------------------------------------------------------------------
 # AdminAddUserPageHandler
 # ---------------------------------------------------------------------------
@@ -78,7 +72,7 @@ class TestAdminAddUserPageHandler(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         self.mock_rest_client = AsyncMock()
         handler = AdminAddUserPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
@@ -191,7 +185,7 @@ class TestAdminModifyUserPageHandler(unittest.IsolatedAsyncioTestCase):
         self.mock_rest_client = AsyncMock()
         self.mock_rest_client.post.return_value = _SESSION_VALID
         handler = AdminModifyUserPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
@@ -304,7 +298,7 @@ class TestAdminResetPasswordPageHandler(unittest.IsolatedAsyncioTestCase):
         self.mock_rest_client = AsyncMock()
         self.mock_rest_client.post.return_value = _SESSION_VALID
         handler = AdminResetPasswordPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+            _LOGGER, _config(), self.mock_rest_client, METADATA)
 
         app = make_app()
 
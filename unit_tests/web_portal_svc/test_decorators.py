@@ -41,128 +41,107 @@ class _FakeHandler:
         return ("admin-result", args, kwargs)
 
 
-class TestRequireSession(unittest.IsolatedAsyncioTestCase):
+class _AppContextTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs every test inside an application context of one shared app."""
+
+    app = Quart(__name__)
+
+    async def asyncSetUp(self):
+        ctx = self.app.app_context()
+        await ctx.push()
+        self.addAsyncCleanup(ctx.pop)
+
+
+class TestRequireSession(_AppContextTestCase):
 
     async def test_calls_wrapped_handler_when_session_valid(self):
         handler = _FakeHandler()
-        app = Quart(__name__)
-        async with app.app_context():
-            result = await handler.protected_method()
+        result = await handler.protected_method()
         self.assertEqual(result, ("handler-result", (), {}))
 
     async def test_passes_through_args_and_kwargs(self):
         handler = _FakeHandler()
-        app = Quart(__name__)
-        async with app.app_context():
-            result = await handler.protected_method(1, b=2)
+        result = await handler.protected_method(1, b=2)
         self.assertEqual(result, ("handler-result", (1,), {"b": 2}))
 
     async def test_sets_g_is_administrator_true_when_valid_admin(self):
         handler = _FakeHandler(is_valid=True, is_administrator=True)
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.protected_method()
-            self.assertTrue(g.is_administrator)
+        await handler.protected_method()
+        self.assertTrue(g.is_administrator)
 
     async def test_sets_g_is_administrator_false_when_not_admin(self):
         handler = _FakeHandler(is_valid=True, is_administrator=False)
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.protected_method()
-            self.assertFalse(g.is_administrator)
+        await handler.protected_method()
+        self.assertFalse(g.is_administrator)
 
     async def test_sets_g_is_administrator_false_when_no_cookies(self):
         handler = _FakeHandler()
         handler._has_auth_cookies.return_value = False
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.protected_method()
-            self.assertFalse(g.is_administrator)
+        await handler.protected_method()
+        self.assertFalse(g.is_administrator)
 
     async def test_redirects_when_no_auth_cookies(self):
         handler = _FakeHandler()
         handler._has_auth_cookies.return_value = False
-        app = Quart(__name__)
-        async with app.app_context():
-            result = await handler.protected_method()
+        result = await handler.protected_method()
         self.assertEqual(result.status_code, 200)
         handler._generate_redirect.assert_called_once_with('login')
 
     async def test_redirects_when_cookies_invalid(self):
         handler = _FakeHandler(is_valid=False)
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.protected_method()
+        await handler.protected_method()
         handler._generate_redirect.assert_called_once_with('login')
 
     async def test_internal_error_page_on_exception(self):
         handler = _FakeHandler()
         handler._validate_cookies.side_effect = BaseItemsException("boom")
-        app = Quart(__name__)
-        async with app.app_context():
-            result = await handler.protected_method()
+        result = await handler.protected_method()
         self.assertEqual(result, "internal-error-page")
         handler._logger.error.assert_called_once()
 
 
-class TestRequireAdministrator(unittest.IsolatedAsyncioTestCase):
+class TestRequireAdministrator(_AppContextTestCase):
 
     async def test_calls_wrapped_handler_when_administrator(self):
         handler = _FakeHandler(is_valid=True, is_administrator=True)
-        app = Quart(__name__)
-        async with app.app_context():
-            result = await handler.admin_method()
+        result = await handler.admin_method()
         self.assertEqual(result, ("admin-result", (), {}))
 
     async def test_passes_through_args_and_kwargs(self):
         handler = _FakeHandler(is_valid=True, is_administrator=True)
-        app = Quart(__name__)
-        async with app.app_context():
-            result = await handler.admin_method(1, b=2)
+        result = await handler.admin_method(1, b=2)
         self.assertEqual(result, ("admin-result", (1,), {"b": 2}))
 
     async def test_sets_g_is_administrator_true_for_admin(self):
         handler = _FakeHandler(is_valid=True, is_administrator=True)
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.admin_method()
-            self.assertTrue(g.is_administrator)
+        await handler.admin_method()
+        self.assertTrue(g.is_administrator)
 
     async def test_redirects_to_login_when_no_auth_cookies(self):
         handler = _FakeHandler(is_valid=True, is_administrator=True)
         handler._has_auth_cookies.return_value = False
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.admin_method()
+        await handler.admin_method()
         handler._generate_redirect.assert_called_once_with('login')
 
     async def test_redirects_to_login_when_session_invalid(self):
         handler = _FakeHandler(is_valid=False, is_administrator=False)
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.admin_method()
+        await handler.admin_method()
         handler._generate_redirect.assert_called_once_with('login')
 
     async def test_redirects_to_dashboard_when_not_administrator(self):
         handler = _FakeHandler(is_valid=True, is_administrator=False)
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.admin_method()
+        await handler.admin_method()
         handler._generate_redirect.assert_called_once_with('')
 
     async def test_sets_g_is_administrator_false_for_non_admin(self):
         handler = _FakeHandler(is_valid=True, is_administrator=False)
-        app = Quart(__name__)
-        async with app.app_context():
-            await handler.admin_method()
-            self.assertFalse(g.is_administrator)
+        await handler.admin_method()
+        self.assertFalse(g.is_administrator)
 
     async def test_internal_error_page_on_exception(self):
         handler = _FakeHandler(is_valid=True, is_administrator=True)
         handler._validate_cookies.side_effect = BaseItemsException("boom")
-        app = Quart(__name__)
-        async with app.app_context():
-            result = await handler.admin_method()
+        result = await handler.admin_method()
         self.assertEqual(result, "internal-error-page")
         handler._logger.error.assert_called_once()
 
@@ -13,6 +13,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import re
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 from http import HTTPStatus
@@ -24,16 +25,16 @@ from items.services.items_web_portal.portal_page_handler import (
     SessionAuthMixin, PortalPageHandler)
 
 
-def _make_app():
-    return Quart(__name__)
+# Every test builds its own request or application context, so a single
+# app serves the whole module.
+_APP = Quart(__name__)
 
 
 class TestSessionAuthMixinGenerateRedirect(unittest.IsolatedAsyncioTestCase):
 
     async def test_generate_redirect_builds_absolute_url(self):
         mixin = SessionAuthMixin(MagicMock(), MagicMock())
-        app = _make_app()
-        async with app.test_request_context('/'):
+        async with _APP.test_request_context('/'):
             result = mixin._generate_redirect('login')
         self.assertIn("http://localhost/login", result)
         self.assertIn("Refresh", result)
@@ -41,24 +42,25 @@ class TestSessionAuthMixinGenerateRedirect(unittest.IsolatedAsyncioTestCase):
 
 class TestHasAuthCookies(unittest.IsolatedAsyncioTestCase):
 
-    async def asyncSetUp(self):
-        self.mixin = SessionAuthMixin(MagicMock(), MagicMock())
-        self.app = _make_app()
+    @classmethod
+    def setUpClass(cls):
+        # Only the request cookies are read, so the mixin is shared.
+        cls.mixin = SessionAuthMixin(MagicMock(), MagicMock())
 
     async def test_true_when_both_cookies_present(self):
-        async with self.app.test_request_context(
+        async with _APP.test_request_context(
                 '/', headers={"Cookie": "items_token=abc; items_user=bob"}):
             result = await self.mixin._has_auth_cookies()
         self.assertTrue(result)
 
     async def test_false_when_token_missing(self):
-        async with self.app.test_request_context(
+        async with _APP.test_request_context(
                 '/', headers={"Cookie": "items_user=bob"}):
             result = await self.mixin._has_auth_cookies()
         self.assertFalse(result)
 
     async def test_false_when_no_cookies(self):
-        async with self.app.test_request_context('/'):
+        async with _APP.test_request_context('/'):
             result = await self.mixin._has_auth_cookies()
         self.assertFalse(result)
 
@@ -70,32 +72,38 @@ class TestValidateCookies(unittest.IsolatedAsyncioTestCase):
         self.mock_config.apis_gateway_svc = "http://gateway/"
         self.mock_rest_client = AsyncMock()
         self.mixin = SessionAuthMixin(self.mock_config, self.mock_rest_client)
-        self.app = _make_app()
 
     async def _validate(self):
-        async with self.app.test_request_context(
+        async with _APP.test_request_context(
                 '/', headers={"Cookie": "items_token=abc; items_user=bob"}):
             return await self.mixin._validate_cookies()
 
-    async def test_non_ok_status_raises_with_exception_msg(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
-            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
-            exception_msg="connection refused")
-        with self.assertRaises(BaseItemsException) as ctx:
-            await self._validate()
-        self.assertIn("connection refused", str(ctx.exception))
-
-    async def test_non_ok_status_raises_without_exception_msg(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
-            status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
-        with self.assertRaises(BaseItemsException):
-            await self._validate()
-
-    async def test_schema_validation_failure_raises(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
-            status_code=HTTPStatus.OK, body={"status": "NOT_A_VALID_ENUM"})
-        with self.assertRaises(BaseItemsException):
-            await self._validate()
+    async def test_unusable_gateway_response_raises(self):
+        schema_error = "Schema for gateway svc session validate response"
+        cases = [
+            ("non_ok_with_exception_msg",
+             ApiResponse(status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                         exception_msg="connection refused"),
+             "connection refused"),
+            ("non_ok_without_exception_msg",
+             ApiResponse(status_code=HTTPStatus.INTERNAL_SERVER_ERROR),
+             "Gateway svc session validate failed"),
+            ("invalid_status_enum",
+             ApiResponse(status_code=HTTPStatus.OK,
+                         body={"status": "NOT_A_VALID_ENUM"}),
+             schema_error),
+            ("is_administrator_wrong_type",
+             ApiResponse(status_code=HTTPStatus.OK,
+                         body={"status": "VALID", "is_administrator": "yes"}),
+             schema_error),
+        ]
+
+        for name, gateway_response, expected_msg in cases:
+            with self.subTest(name):
+                self.mock_rest_client.post.return_value = gateway_response
+                with self.assertRaisesRegex(BaseItemsException,
+                                            re.escape(expected_msg)):
+                    await self._validate()
 
     async def test_valid_status_returns_true_and_is_administrator_false(self):
         self.mock_rest_client.post.return_value = ApiResponse(
@@ -127,36 +135,36 @@ class TestValidateCookies(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(is_valid)
         self.assertFalse(is_administrator)
 
-    async def test_is_administrator_wrong_type_raises(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
-            status_code=HTTPStatus.OK,
-            body={"status": "VALID", "is_administrator": "yes"})
-        with self.assertRaises(BaseItemsException):
-            await self._validate()
-
 
 class TestPortalPageHandlerRenderPage(unittest.IsolatedAsyncioTestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.handler = PortalPageHandler(MagicMock(), MagicMock(), MagicMock())
+
     async def asyncSetUp(self):
-        self.handler = PortalPageHandler(MagicMock(), MagicMock(), MagicMock())
-        self.app = _make_app()
+        # The handler is shared; clear the logger calls of earlier tests.
+        self.handler._logger.reset_mock()
 
-    async def test_render_success(self):
-        with patch(
+        render_patcher = patch(
             "items.services.items_web_portal.portal_page_handler."
-            "render_template", new=AsyncMock(return_value="<html/>")):
-            async with self.app.app_context():
-                result = await self.handler._render_page("some_page.html")
+            "render_template", new_callable=AsyncMock)
+        self.mock_render = render_patcher.start()
+        self.addCleanup(render_patcher.stop)
+
+    async def _render(self):
+        async with _APP.app_context():
+            return await self.handler._render_page("some_page.html")
+
+    async def test_render_success(self):
+        self.mock_render.return_value = "<html/>"
+        result = await self._render()
         self.assertEqual(result, "<html/>")
 
     async def test_render_failure_falls_back_to_internal_error_page(self):
-        mock_render = AsyncMock(
-            side_effect=[jinja2.TemplateError("bad template"), "<error/>"])
-        with patch(
-            "items.services.items_web_portal.portal_page_handler."
-            "render_template", new=mock_render):
-            async with self.app.app_context():
-                result = await self.handler._render_page("some_page.html")
+        self.mock_render.side_effect = [
+            jinja2.TemplateError("bad template"), "<error/>"]
+        result = await self._render()
         self.assertEqual(result, "<error/>")
         self.handler._logger.error.assert_called_once()
 
@@ -13,11 +13,13 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import asyncio
+import copy
 import unittest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, call
 from http import HTTPStatus
 from weaver_framework.microservice.api_response import ApiResponse
-from _test_utils import make_app
+from _test_utils import METADATA, make_app
 from items.services.items_web_portal.page_handlers.projects.\
     get_project_overview_page_handler import GetProjectOverviewPageHandler
 from items.services.items_web_portal.page_handlers.testcases.\
@@ -33,39 +35,96 @@ def _config():
     return config
 
 
-def _metadata():
-    metadata = MagicMock()
-    metadata.instance_name = "INSTANCE"
-    return metadata
-
-
-# ------------------------------------------------------------------
-# GetProjectOverviewPageHandler
-# ------------------------------------------------------------------
-
-class TestGetProjectOverviewPageHandler(unittest.IsolatedAsyncioTestCase):
+_ROOT_FOLDER = {"id": 1, "parent_id": None, "name": "Root"}
+_CHILD_FOLDER = {"id": 2, "parent_id": 1, "name": "Child"}
+_ORPHAN_FOLDER = {"id": 3, "parent_id": 999, "name": "Orphan"}
+_CASE_IN_ROOT = {"id": 10, "folder_id": 1, "name": "TC-1"}
+_CASE_IN_CHILD = {"id": 11, "folder_id": 2, "name": "TC-2"}
+_CASE_ORPHANED = {"id": 12, "folder_id": 999, "name": "TC-3"}
+
+# (name, gateway data, expected tree) rows for the transform tests. The
+# transform must not modify its input, so the rows are shared read-only.
+_TRANSFORM_CASES = [
+    ("empty", {"folders": [], "test_cases": []}, []),
+    ("single_folder",
+     {"folders": [_ROOT_FOLDER], "test_cases": []},
+     [{**_ROOT_FOLDER, "subfolders": [], "test_cases": []}]),
+    ("nested",
+     {"folders": [_ROOT_FOLDER, _CHILD_FOLDER], "test_cases": []},
+     [{**_ROOT_FOLDER, "test_cases": [],
+       "subfolders": [{**_CHILD_FOLDER, "subfolders": [],
+                       "test_cases": []}]}]),
+    ("with_tests",
+     {"folders": [_ROOT_FOLDER, _CHILD_FOLDER],
+      "test_cases": [_CASE_IN_ROOT, _CASE_IN_CHILD]},
+     [{**_ROOT_FOLDER, "test_cases": [_CASE_IN_ROOT],
+       "subfolders": [{**_CHILD_FOLDER, "subfolders": [],
+                       "test_cases": [_CASE_IN_CHILD]}]}]),
+    ("orphaned_test_case_dropped",
+     {"folders": [_ROOT_FOLDER], "test_cases": [_CASE_ORPHANED]},
+     [{**_ROOT_FOLDER, "subfolders": [], "test_cases": []}]),
+    ("missing_parent_dropped",
+     {"folders": [_ROOT_FOLDER, _ORPHAN_FOLDER, _CHILD_FOLDER],
+      "test_cases": [_CASE_IN_CHILD, _CASE_ORPHANED]},
+     [{**_ROOT_FOLDER, "test_cases": [],
+       "subfolders": [{**_CHILD_FOLDER, "subfolders": [],
+                       "test_cases": [_CASE_IN_CHILD]}]}]),
+]
+
+_transform = GetProjectTestcasesPageHandler._transform_tests_details_data
+
+_REST_CLIENT = AsyncMock()
+
+
+def _build_app():
+    """Register both project page handlers on one app, sharing a single
+    mocked REST client."""
+    overview_handler = GetProjectOverviewPageHandler(
+        _LOGGER, _config(), _REST_CLIENT, METADATA)
+    testcases_handler = GetProjectTestcasesPageHandler(
+        _LOGGER, _config(), _REST_CLIENT, METADATA)
+
+    app = make_app()
+
+    @app.route("/<int:project_id>/overview", methods=["GET"])
+    async def project_overview(project_id):
+        return await overview_handler.project_overview(project_id)
+
+    @app.route("/<project_id>/testcases", methods=["GET"])
+    async def test_cases(project_id):
+        return await testcases_handler.test_cases(project_id)
+
+    return app
+
+
+_APP = _build_app()
+
+
+class _ProjectPageTestCase(unittest.IsolatedAsyncioTestCase):
+    """Serves each test from the shared app with a fresh client, a freshly
+    reset REST client mock and a valid session."""
+
+    rest_client = _REST_CLIENT
 
     async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        self.mock_rest_client.post.return_value = ApiResponse(
+        self.rest_client.reset_mock(return_value=True, side_effect=True)
+        self.rest_client.post.return_value = ApiResponse(
             status_code=HTTPStatus.OK, body={"status": "VALID"})
-        handler = GetProjectOverviewPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
+        self.client = _APP.test_client()
 
-        app = make_app()
 
-        @app.route("/<int:project_id>/overview", methods=["GET"])
-        async def route(project_id):
-            return await handler.project_overview(project_id)
+# ------------------------------------------------------------------
+# GetProjectOverviewPageHandler
+# ------------------------------------------------------------------
 
-        self.client = app.test_client()
+class TestGetProjectOverviewPageHandler(_ProjectPageTestCase):
 
     async def _get(self):
         async with self.client as c:
             return await c.get("/1/overview", headers=_AUTH_HEADERS)
 
     async def test_no_session_redirects_to_login(self):
-        self.mock_rest_client.post.return_value = ApiResponse(
+        self.rest_client.post.return_value = ApiResponse(
             status_code=HTTPStatus.OK, body={"status": "INVALID"})
         response = await self._get()
         self.assertEqual(response.status_code, 200)
@@ -73,17 +132,17 @@ class TestGetProjectOverviewPageHandler(unittest.IsolatedAsyncioTestCase):
         self.assertIn("login", text)
 
     async def test_not_found_returns_404(self):
-        self.mock_rest_client.get.return_value = ApiResponse(status_code=404)
+        self.rest_client.get.return_value = ApiResponse(status_code=404)
         response = await self._get()
         self.assertEqual(response.status_code, 404)
 
     async def test_other_error_returns_500(self):
-        self.mock_rest_client.get.return_value = ApiResponse(status_code=503)
+        self.rest_client.get.return_value = ApiResponse(status_code=503)
         response = await self._get()
         self.assertEqual(response.status_code, 500)
 
     async def test_success_renders_page(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=HTTPStatus.OK,
             body={"name": "Project X", "announcement": "hi",
                  "show_announcement_on_overview": True})
@@ -93,7 +152,7 @@ class TestGetProjectOverviewPageHandler(unittest.IsolatedAsyncioTestCase):
         self.assertIn("Project X", text)
 
     async def test_success_defaults_when_fields_missing(self):
-        self.mock_rest_client.get.return_value = ApiResponse(
+        self.rest_client.get.return_value = ApiResponse(
             status_code=HTTPStatus.OK, body={})
         response = await self._get()
         self.assertEqual(response.status_code, 200)
@@ -105,29 +164,14 @@ class TestGetProjectOverviewPageHandler(unittest.IsolatedAsyncioTestCase):
 # GetProjectTestcasesPageHandler
 # ------------------------------------------------------------------
 
-class TestGetProjectTestcasesPageHandler(unittest.IsolatedAsyncioTestCase):
-
-    async def asyncSetUp(self):
-        self.mock_rest_client = AsyncMock()
-        self.mock_rest_client.post.return_value = ApiResponse(
-            status_code=HTTPStatus.OK, body={"status": "VALID"})
-        handler = GetProjectTestcasesPageHandler(
-            _LOGGER, _config(), self.mock_rest_client, _metadata())
-
-        app = make_app()
-
-        @app.route("/<project_id>/testcases", methods=["GET"])
-        async def route(project_id):
-            return await handler.test_cases(project_id)
-
-        self.client = app.test_client()
+class TestGetProjectTestcasesPageHandler(_ProjectPageTestCase):
 
     async def _get(self):
         async with self.client as c:
             return await c.get("/1/testcases", headers=_AUTH_HEADERS)
 
     async def test_testcases_fetch_failure_returns_500(self):
-        self.mock_rest_client.get.side_effect = [
+        self.rest_client.get.side_effect = [
             ApiResponse(status_code=HTTPStatus.OK, body={"name": "Proj"}),
             ApiResponse(status_code=503),
         ]
@@ -135,7 +179,7 @@ class TestGetProjectTestcasesPageHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(response.status_code, 500)
 
     async def test_project_name_lookup_failure_falls_back_to_unknown(self):
-        self.mock_rest_client.get.side_effect = [
+        self.rest_client.get.side_effect = [
             ApiResponse(status_code=503),
             ApiResponse(status_code=HTTPStatus.OK,
                        body={"folders": [], "test_cases": []}),
@@ -146,7 +190,7 @@ class TestGetProjectTestcasesPageHandler(unittest.IsolatedAsyncioTestCase):
         self.assertIn("Unknown Project", text)
 
     async def test_success_builds_folder_tree(self):
-        self.mock_rest_client.get.side_effect = [
+        self.rest_client.get.side_effect = [
             ApiResponse(status_code=HTTPStatus.OK, body={"name": "Proj"}),
             ApiResponse(status_code=HTTPStatus.OK, body={
                 "folders": [
@@ -165,8 +209,38 @@ class TestGetProjectTestcasesPageHandler(unittest.IsolatedAsyncioTestCase):
         text = await response.get_data(as_text=True)
         self.assertIn("Proj", text)
 
+    async def test_requests_project_and_testcases(self):
+        self.rest_client.get.side_effect = [
+            ApiResponse(status_code=HTTPStatus.OK, body={"name": "Proj"}),
+            ApiResponse(status_code=HTTPStatus.OK,
+                       body={"folders": [], "test_cases": []}),
+        ]
+        await self._get()
+        self.rest_client.get.assert_has_awaits([
+            call("http://gateway/web/projects/1"),
+            call("http://gateway/web/1/testcases"),
+        ])
+
+    async def test_request_failure_cancels_the_other_request(self):
+        cancelled = asyncio.Event()
+
+        async def get(url):
+            if url.endswith("/testcases"):
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        self.rest_client.get.side_effect = get
+        response = await self._get()
+        await asyncio.sleep(0)
+        self.assertEqual(response.status_code, 500)
+        self.assertTrue(cancelled.is_set())
+
     async def test_no_testcases_sets_has_testcases_false(self):
-        self.mock_rest_client.get.side_effect = [
+        self.rest_client.get.side_effect = [
             ApiResponse(status_code=HTTPStatus.OK, body={"name": "Proj"}),
             ApiResponse(status_code=HTTPStatus.OK,
                        body={"folders": [], "test_cases": []}),
@@ -175,5 +249,25 @@ class TestGetProjectTestcasesPageHandler(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(response.status_code, 200)
 
 
+# ------------------------------------------------------------------
+# GetProjectTestcasesPageHandler._transform_tests_details_data
+# ------------------------------------------------------------------
+
+class TestTransformTestsDetailsData(unittest.TestCase):
+    """Direct unit tests for the folder/test case tree transform. It is a
+    pure function of the gateway data, so no handler or app is built."""
+
+    def test_transform(self):
+        for name, data, expected in _TRANSFORM_CASES:
+            with self.subTest(name):
+                self.assertEqual(_transform(data), expected)
+
+    def test_transform_does_not_modify_input(self):
+        _, data, _ = _TRANSFORM_CASES[-1]
+        snapshot = copy.deepcopy(data)
+        _transform(data)
+        self.assertEqual(data, snapshot)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -92,23 +92,24 @@ class TestServiceInitialise(unittest.IsolatedAsyncioTestCase):
             new_callable=PropertyMock,
             return_value=self.mock_bm_logger)
         self._logger_patcher.start()
+        self.addCleanup(self._logger_patcher.stop)
 
         self._session_patcher = patch(
             "items.services.items_web_portal.service.aiohttp.ClientSession",
             return_value=AsyncMock())
         self._session_patcher.start()
+        self.addCleanup(self._session_patcher.stop)
 
         self._rest_client_patcher = patch(
             "items.services.items_web_portal.service.RestClient")
         self._rest_client_patcher.start()
+        self.addCleanup(self._rest_client_patcher.stop)
 
         self._create_page_handlers_patcher = patch(
             "items.services.items_web_portal.service.create_page_handlers",
             return_value=MagicMock())
         self._create_page_handlers_patcher.start()
-
-    async def asyncTearDown(self):
-        patch.stopall()
+        self.addCleanup(self._create_page_handlers_patcher.stop)
 
     async def test_initialise_returns_false_when_manage_configuration_fails(self):
         with patch.object(self.service, '_manage_configuration',